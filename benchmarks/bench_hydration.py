@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Микробенчмарк разбора строк задач: прежний путь (sqlite3.Row, SELECT *,
+полный Task.__init__, datetime.fromisoformat на каждую метку времени)
+против текущего DatabaseManager.get_all_tasks()
+
+Запуск: python benchmarks/bench_hydration.py [количество задач]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database.database_manager import TASK_SELECT, DatabaseManager
+from models.task import Task
+
+
+def legacy_row_to_task(row) -> Task:
+    # Копия прежней реализации DatabaseManager._row_to_task
+    task = Task(
+        title=row['title'],
+        description=row['description'],
+        priority=row['priority'],
+        due_date=datetime.fromisoformat(row['due_date']),
+        project_id=row['project_id'],
+        assignee_id=row['assignee_id']
+    )
+    task.id = row['id']
+    task.status = row['status']
+    task.created_at = datetime.fromisoformat(row['created_at'])
+    return task
+
+
+def legacy_get_all_tasks(connection) -> list:
+    results = connection.execute("SELECT * FROM tasks ORDER BY created_at DESC").fetchall()
+    return [legacy_row_to_task(row) for row in results]
+
+
+def best_of(func, repeat=5) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def report(legacy, current, count) -> None:
+    print(f"  прежний: {legacy:.3f} с ({legacy / count * 1e6:.2f} мкс/строка)")
+    print(f"  текущий: {current:.3f} с ({current / count * 1e6:.2f} мкс/строка)")
+    print(f"  ускорение: x{legacy / current:.1f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    db_manager = DatabaseManager(db_path)
+
+    # Сроки повторяются (как при реальном планировании по дням)
+    base = datetime(2030, 1, 1, 12, 0)
+    db_manager.add_tasks_bulk(
+        Task(f"Task {i}", "Description", i % 3 + 1, base + timedelta(days=i % 90), 1, 1)
+        for i in range(count)
+    )
+
+    legacy_connection = sqlite3.connect(db_path)
+    legacy_connection.row_factory = sqlite3.Row
+    legacy_rows = legacy_connection.execute("SELECT * FROM tasks").fetchall()
+    current_rows = db_manager.connection.execute(TASK_SELECT).fetchall()
+
+    # Только разбор уже прочитанных строк в объекты Task
+    legacy_hydration = best_of(lambda: [legacy_row_to_task(row) for row in legacy_rows])
+    current_hydration = best_of(lambda: [db_manager._row_to_task(row) for row in current_rows])
+
+    # Полный путь: запрос + чтение строк + разбор
+    legacy_total = best_of(lambda: legacy_get_all_tasks(legacy_connection))
+    current_total = best_of(db_manager.get_all_tasks)
+
+    print(f"Задач: {count}")
+    print("Разбор строк:")
+    report(legacy_hydration, current_hydration, count)
+    print("get_all_tasks целиком:")
+    report(legacy_total, current_total, count)
+
+    legacy_connection.close()
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк памяти моделей: байт на объект Task до перехода на __slots__
+(обычный класс с __dict__, статус - отдельная строка из базы в каждой задаче)
+и после (__slots__ + интернированные статусы)
+
+Запуск: python benchmarks/bench_models_memory.py [количество задач]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+class LegacyTask:
+    # Копия прежней модели Task: атрибуты хранятся в __dict__ экземпляра
+    def __init__(self, title, description, priority, due_date, project_id, assignee_id) -> None:
+        self.id = None
+        self.title = title
+        self.description = description
+        self.priority = priority
+        self.status = 'pending'
+        self.due_date = due_date
+        self.project_id = project_id
+        self.assignee_id = assignee_id
+        self.created_at = datetime.now()
+
+
+def legacy_row_to_task(row) -> LegacyTask:
+    # Прежний разбор строки: статус остается отдельной строкой из sqlite3
+    task = LegacyTask(
+        title=row['title'],
+        description=row['description'],
+        priority=row['priority'],
+        due_date=datetime.fromisoformat(row['due_date']),
+        project_id=row['project_id'],
+        assignee_id=row['assignee_id']
+    )
+    task.id = row['id']
+    task.status = row['status']
+    task.created_at = datetime.fromisoformat(row['created_at'])
+    return task
+
+
+def measure(build) -> int:
+    # Объем памяти, удерживаемой результатом build()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    due_date = datetime(2030, 1, 1)
+
+    # 1. Накладные расходы самого объекта при одинаковых значениях полей
+    legacy_object = measure(lambda: [
+        LegacyTask("Task", "Description", 2, due_date, 1, 1) for _ in range(count)
+    ])
+    slots_object = measure(lambda: [
+        Task("Task", "Description", 2, due_date, 1, 1) for _ in range(count)
+    ])
+
+    # 2. Задачи, прочитанные из базы, включая строки и даты
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    db_manager = DatabaseManager(db_path)
+    db_manager.add_tasks_bulk(
+        Task(f"Task {i}", "Description", i % 3 + 1, due_date + timedelta(days=i % 90), 1, 1)
+        for i in range(count)
+    )
+    legacy_connection = sqlite3.connect(db_path)
+    legacy_connection.row_factory = sqlite3.Row
+    # Прогрев кэша разбора дат, чтобы он не попал в замер
+    db_manager.get_all_tasks()
+
+    legacy_loaded = measure(lambda: [
+        legacy_row_to_task(row)
+        for row in legacy_connection.execute("SELECT * FROM tasks").fetchall()
+    ])
+    slots_loaded = measure(db_manager.get_all_tasks)
+
+    print(f"Задач: {count}")
+    print("Объект с одинаковыми полями (байт на задачу):")
+    print(f"  __dict__:  {legacy_object / count:.0f}")
+    print(f"  __slots__: {slots_object / count:.0f}")
+    print("Задача, прочитанная из базы (байт на задачу):")
+    print(f"  прежняя модель: {legacy_loaded / count:.0f}")
+    print(f"  текущая модель: {slots_loaded / count:.0f}")
+
+    legacy_connection.close()
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
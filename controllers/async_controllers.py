@@ -0,0 +1,36 @@
+from controllers.task_controller import TaskController
+from controllers.project_controller import ProjectController
+from controllers.user_controller import UserController
+
+
+class AsyncController:
+    # Асинхронная обертка над синхронным контроллером: та же валидация и
+    # те же результаты, но работа с SQLite уходит в потоки AsyncDatabaseManager
+    controller_class = None
+
+    def __init__(self, async_db_manager) -> None:
+        self.async_db_manager = async_db_manager
+        self.controller = self.controller_class(async_db_manager.db_manager)
+
+    def __getattr__(self, name):
+        attr = getattr(self.controller, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        async def method(*args, **kwargs):
+            return await self.async_db_manager.run(name, attr, *args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+
+class AsyncTaskController(AsyncController):
+    controller_class = TaskController
+
+
+class AsyncProjectController(AsyncController):
+    controller_class = ProjectController
+
+
+class AsyncUserController(AsyncController):
+    controller_class = UserController
@@ -25,6 +25,27 @@ class ProjectController:
         
         return self.db_manager.add_project(project)
 
+    def add_projects(self, projects_data) -> list[int]:
+        
+        now = datetime.now()
+        projects = []
+        for data in projects_data:
+            if data['start_date'] >= data['end_date']:
+                raise ValueError("Дата окончания должна быть позже даты начала")
+            
+            if data['start_date'] < now:
+                raise ValueError("Дата начала не может быть в прошлом")
+            
+            projects.append(Project(
+                name=data['name'],
+                description=data['description'],
+                start_date=data['start_date'],
+                end_date=data['end_date']
+            ))
+        
+        with self.db_manager.transaction():
+            return self.db_manager.add_projects_bulk(projects)
+
     def get_project(self, project_id) -> Project | None:
        
         return self.db_manager.get_project_by_id(project_id)
@@ -33,6 +54,10 @@ class ProjectController:
       
         return self.db_manager.get_all_projects()
 
+    def get_projects_page(self, limit=50, cursor=None) -> tuple:
+        
+        return self.db_manager.get_projects_page(limit=limit, cursor=cursor)
+
     def update_project(self, project_id, **kwargs) -> bool:
        
         if 'status' in kwargs and kwargs['status'] not in ['active', 'completed', 'on_hold']:
@@ -48,11 +73,14 @@ class ProjectController:
     def delete_project(self, project_id) -> bool:
        
         
-        project_tasks = self.db_manager.get_tasks_by_project(project_id)
-        if project_tasks:
-            raise ValueError("Нельзя удалить проект с задачами. Сначала удалите или переместите задачи.")
-        
-        return self.db_manager.delete_project(project_id)
+        # Проверка и удаление в одной транзакции
+        with self.db_manager.transaction():
+            if self.db_manager.count_tasks_for_project(project_id):
+                raise ValueError(
+                    "Нельзя удалить проект с задачами. Сначала удалите или переместите задачи."
+                )
+            
+            return self.db_manager.delete_project(project_id)
 
     def update_project_status(self, project_id, new_status) -> bool:
       
@@ -64,18 +92,26 @@ class ProjectController:
 
     def get_project_progress(self, project_id) -> float:
        
-        project = self.get_project(project_id)
-        if not project:
+        stats = self.db_manager.get_project_task_stats(project_id)
+        if project_id not in stats:
             raise ValueError("Проект не найден")
         
+        total, completed = stats[project_id]
+        return self._progress_percent(total, completed)
+
+    def get_all_project_progress(self) -> dict:
         
-        tasks = self.db_manager.get_tasks_by_project(project_id)
+        # {project_id: (всего задач, завершено, процент)} за один запрос
+        return {
+            project_id: (total, completed, self._progress_percent(total, completed))
+            for project_id, (total, completed) in self.db_manager.get_project_task_stats().items()
+        }
+
+    @staticmethod
+    def _progress_percent(total, completed) -> float:
         
-        if not tasks:
+        if not total:
             return 0.0
         
-     
-        completed_tasks = sum(1 for task in tasks if task.status == 'completed')
-        progress = (completed_tasks / len(tasks)) * 100.0
-        
+        progress = (completed / total) * 100.0
         return round(progress, 2)
\ No newline at end of file
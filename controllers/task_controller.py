@@ -28,6 +28,31 @@ class TaskController:
         
         return self.db_manager.add_task(task)
 
+    def add_tasks(self, tasks_data) -> list[int]:
+        
+        # Валидируем всю пачку до вставки, чтобы не записать ее частично
+        now = datetime.now()
+        tasks = []
+        for data in tasks_data:
+            if data['priority'] not in [1, 2, 3]:
+                raise ValueError("Приоритет должен быть 1, 2 или 3")
+            
+            if data['due_date'] < now:
+                raise ValueError("Срок выполнения не может быть в прошлом")
+            
+            tasks.append(Task(
+                title=data['title'],
+                description=data['description'],
+                priority=data['priority'],
+                due_date=data['due_date'],
+                project_id=data['project_id'],
+                assignee_id=data['assignee_id']
+            ))
+        
+        # Вся пачка - одна транзакция: либо добавлены все задачи, либо ни одной
+        with self.db_manager.transaction():
+            return self.db_manager.add_tasks_bulk(tasks)
+
     def get_task(self, task_id) -> Task | None:
        
         return self.db_manager.get_task_by_id(task_id)
@@ -36,6 +61,24 @@ class TaskController:
         
         return self.db_manager.get_all_tasks()
 
+    def get_task_listing(self, filters=None, limit=None, cursor=None) -> tuple:
+        
+        return self.db_manager.get_task_listing(filters=filters, limit=limit, cursor=cursor)
+
+    def get_task_listing_window(self, offset, limit, filters=None) -> list:
+        
+        return self.db_manager.get_task_listing_window(offset, limit, filters=filters)
+
+    def count_task_listing(self, filters=None) -> int:
+        
+        return self.db_manager.count_task_listing(filters=filters)
+
+    def get_tasks_page(self, limit=50, cursor=None, project_id=None, assignee_id=None) -> tuple:
+        
+        return self.db_manager.get_tasks_page(
+            limit=limit, cursor=cursor, project_id=project_id, assignee_id=assignee_id
+        )
+
     def update_task(self, task_id, **kwargs) -> bool:
        
         
@@ -52,12 +95,12 @@ class TaskController:
         
         return self.db_manager.delete_task(task_id)
 
-    def search_tasks(self, query) -> list[Task]:
+    def search_tasks(self, query, limit=None) -> list[Task]:
         
         if not query or not query.strip():
             return []
         
-        return self.db_manager.search_tasks(query.strip())
+        return self.db_manager.search_tasks(query.strip(), limit=limit)
 
     def update_task_status(self, task_id, new_status) -> bool:
       
@@ -67,10 +110,35 @@ class TaskController:
         
         return self.db_manager.update_task(task_id, status=new_status)
 
-    def get_overdue_tasks(self) -> list[Task]:
+    def update_task_status_many(self, task_ids, new_status) -> int:
+        
+        # Статус проверяется один раз на весь набор; результат - число обновленных задач
+        valid_statuses = ['pending', 'in_progress', 'completed']
+        if new_status not in valid_statuses:
+            raise ValueError(f"Некорректный статус. Допустимые: {valid_statuses}")
+        
+        return self.db_manager.update_tasks_where(task_ids, status=new_status)
+
+    def get_overdue_tasks(self, include_completed=False, limit=None) -> list[Task]:
         
-        all_tasks = self.db_manager.get_all_tasks()
-        return [task for task in all_tasks if task.is_overdue()]
+        # Фильтрация выполняется в SQL, завершенные задачи по умолчанию не считаются просроченными
+        return self.db_manager.get_overdue_tasks(include_completed=include_completed, limit=limit)
+
+    def get_overdue_summary(self, include_completed=False) -> dict:
+        
+        # Один момент времени для обеих группировок, чтобы итоги сходились
+        now = datetime.now()
+        by_project = self.db_manager.count_overdue_tasks(
+            'project_id', now=now, include_completed=include_completed
+        )
+        by_assignee = self.db_manager.count_overdue_tasks(
+            'assignee_id', now=now, include_completed=include_completed
+        )
+        return {
+            'total': sum(by_project.values()),
+            'by_project': by_project,
+            'by_assignee': by_assignee
+        }
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
         
@@ -78,4 +146,20 @@ class TaskController:
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
       
-        return self.db_manager.get_tasks_by_user(user_id)
\ No newline at end of file
+        return self.db_manager.get_tasks_by_user(user_id)
+
+    def count_tasks_by_project(self, by_status=False) -> dict:
+        
+        return self.db_manager.count_tasks_by_project(by_status=by_status)
+
+    def count_tasks_by_user(self, by_status=False) -> dict:
+        
+        return self.db_manager.count_tasks_by_user(by_status=by_status)
+
+    def count_tasks_for_project(self, project_id, status=None) -> int:
+        
+        return self.db_manager.count_tasks_for_project(project_id, status=status)
+
+    def count_tasks_for_user(self, user_id, status=None) -> int:
+        
+        return self.db_manager.count_tasks_for_user(user_id, status=status)
\ No newline at end of file
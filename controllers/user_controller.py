@@ -1,5 +1,14 @@
+from collections import namedtuple
+from itertools import islice
 from models.user import User
 
+# Строка отчета import_users: номер во входных данных, итог, id и причина
+UserImportResult = namedtuple("UserImportResult", ("index", "status", "user_id", "reason"))
+
+IMPORT_INSERTED = "inserted"
+IMPORT_DUPLICATE = "duplicate"
+IMPORT_INVALID = "invalid"
+
 class UserController:
     def __init__(self, db_manager) -> None:
         self.db_manager = db_manager
@@ -20,6 +29,73 @@ class UserController:
         
         return self.db_manager.add_user(user)
 
+    def add_users(self, users_data) -> list[int]:
+        
+        valid_roles = ['admin', 'manager', 'developer']
+        users = []
+        for data in users_data:
+            if data['role'] not in valid_roles:
+                raise ValueError(f"Некорректная роль. Допустимые: {valid_roles}")
+            
+            # User сам проверяет email
+            users.append(User(
+                username=data['username'],
+                email=data['email'],
+                role=data['role']
+            ))
+        
+        with self.db_manager.transaction():
+            return self.db_manager.add_users_bulk(users)
+
+    def import_users(self, users_data, chunk_size=1000) -> list[UserImportResult]:
+        
+        # В отличие от add_users не падает на первой плохой строке:
+        # невалидные строки и конфликты username/email попадают в отчет,
+        # остальные вставляются пачками по chunk_size (одна транзакция на пачку)
+        report = []
+        rows = enumerate(users_data)
+        
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            
+            report.extend(self._import_chunk(chunk))
+        
+        report.sort(key=lambda result: result.index)
+        return report
+
+    def _import_chunk(self, chunk) -> list[UserImportResult]:
+        
+        # chunk - пары (номер строки, данные); вставка одной транзакцией
+        report = []
+        valid = []
+        for index, data in chunk:
+            try:
+                valid.append((index, self._validate_import_row(data)))
+            except (ValueError, AttributeError) as e:
+                report.append(UserImportResult(index, IMPORT_INVALID, None, str(e)))
+        
+        ids = self.db_manager.add_users_skip_conflicts(
+            [user for _, user in valid], chunk_size=len(chunk)
+        )
+        for (index, _), user_id in zip(valid, ids):
+            if user_id is None:
+                report.append(UserImportResult(
+                    index, IMPORT_DUPLICATE, None, "Имя пользователя или email уже заняты"
+                ))
+            else:
+                report.append(UserImportResult(index, IMPORT_INSERTED, user_id, None))
+        return report
+
+    @staticmethod
+    def _validate_import_row(data) -> User:
+        
+        # User сам проверяет email и роль; AttributeError - строка не словарь
+        if not data.get('username'):
+            raise ValueError("Не указано имя пользователя")
+        return User(data['username'], data.get('email'), data.get('role'))
+
     def get_user(self, user_id) -> User | None:
        
         return self.db_manager.get_user_by_id(user_id)
@@ -28,6 +104,10 @@ class UserController:
         
         return self.db_manager.get_all_users()
 
+    def get_users_page(self, limit=50, cursor=None) -> tuple:
+        
+        return self.db_manager.get_users_page(limit=limit, cursor=cursor)
+
     def update_user(self, user_id, **kwargs) -> bool:
        
         if 'role' in kwargs:
@@ -45,11 +125,14 @@ class UserController:
 
     def delete_user(self, user_id) -> bool:
     
-        user_tasks = self.db_manager.get_tasks_by_user(user_id)
-        if user_tasks:
-            raise ValueError("Нельзя удалить пользователя с задачами. Сначала переназначьте или удалите задачи.")
-        
-        return self.db_manager.delete_user(user_id)
+        with self.db_manager.transaction():
+            if self.db_manager.count_tasks_for_user(user_id):
+                raise ValueError(
+                    "Нельзя удалить пользователя с задачами. "
+                    "Сначала переназначьте или удалите задачи."
+                )
+            
+            return self.db_manager.delete_user(user_id)
 
     def get_user_tasks(self, user_id) -> list:
         
@@ -0,0 +1,109 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from database.database_manager import DatabaseManager
+
+# Методы с такими префиксами пишут в базу и выполняются единственным потоком записи.
+# Префикс влияет только на выбор потока: запись из потока чтения все равно
+# сериализуется _write_lock менеджера
+WRITE_PREFIXES = ("add_", "update_", "delete_", "create_", "migrate_", "import_")
+
+
+def is_write_method(name) -> bool:
+    return name.startswith(WRITE_PREFIXES)
+
+
+class AsyncDatabaseManager:
+    def __init__(self, db_path="tasks.db", read_workers=4, **kwargs) -> None:
+        # Каждому потоку чтения - свое соединение из пула (WAL), запись
+        # сериализуется одним потоком, поэтому корутины не блокируют event loop
+        # и не ждут друг друга на чтении
+        self.db_manager = DatabaseManager(db_path, pool_size=read_workers, **kwargs)
+        self._read_executor = ThreadPoolExecutor(read_workers, thread_name_prefix="db-read")
+        self._write_executor = ThreadPoolExecutor(1, thread_name_prefix="db-write")
+
+    async def run_read(self, func, *args, **kwargs):
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._read_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run_write(self, func, *args, **kwargs):
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._write_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run(self, name, func, *args, **kwargs):
+
+        # Выбор потока по имени метода синхронного API
+        if is_write_method(name):
+            return await self.run_write(func, *args, **kwargs)
+        return await self.run_read(func, *args, **kwargs)
+
+    async def transaction(self, func, *args, **kwargs):
+
+        # Единица работы целиком выполняется в потоке записи:
+        # func(db_manager, ...) вызывается внутри db_manager.transaction()
+        def run_in_transaction():
+            with self.db_manager.transaction():
+                return func(self.db_manager, *args, **kwargs)
+
+        return await self.run_write(run_in_transaction)
+
+    def __getattr__(self, name):
+        # Вызывается только для отсутствующих атрибутов: методы
+        # DatabaseManager превращаются в корутины с тем же результатом
+        attr = getattr(self.db_manager, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        if name.startswith("iter_"):
+            # iter_tasks -> get_tasks_page с теми же фильтрами
+            page_method = getattr(self.db_manager, f"get_{name[len('iter_'):]}_page")
+            return functools.partial(self._iterate, attr, page_method)
+
+        async def method(*args, **kwargs):
+            return await self.run(name, attr, *args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+    async def _iterate(self, iter_method, page_method, *args, **kwargs):
+
+        # Асинхронный аналог iter_*: каждая пачка - отдельная keyset-страница
+        # get_*_page. Между пачками ни соединение пула, ни поток чтения не
+        # заняты, поэтому одновременных итераторов может быть больше read_workers
+        arguments = inspect.signature(iter_method).bind(*args, **kwargs).arguments
+        batch_size = arguments.pop("batch_size", 500)
+        cursor = None
+        while True:
+            batch, cursor = await self.run_read(
+                page_method, limit=batch_size, cursor=cursor, **arguments
+            )
+            for item in batch:
+                yield item
+            if cursor is None:
+                break
+
+    async def close(self) -> None:
+
+        # Ожидание незавершенных запросов блокирует поток, поэтому выполняется
+        # в пуле по умолчанию, а event loop продолжает обслуживать другие корутины
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
+        self.db_manager.close()
+
+    async def __aenter__(self) -> 'AsyncDatabaseManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, maxsize=256, ttl=None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl  # Время жизни записи в секундах, None - без ограничения
+        self._entries = OrderedDict()  # key -> (value, момент записи)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Номер поколения растет при каждой инвалидации: значение, прочитанное
+        # из базы до нее, может быть устаревшим и в кэш не кладется
+        self.generation = 0
+        # Ключи, инвалидированные с последнего коммита (None - весь кэш)
+        self._pending = set()
+
+    def get(self, key):
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, generation=None) -> None:
+
+        # generation - значение self.generation, взятое до чтения value из базы
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+
+            # Вытесняем давно не использованные записи
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key) -> None:
+
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._pending is not None:
+                self._pending.add(key)
+            self.generation += 1
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self._pending = None
+            self.generation += 1
+
+    def commit(self) -> None:
+
+        # Между инвалидацией и коммитом читатель мог положить в кэш старую
+        # строку - инвалидированные ключи удаляются повторно, а начатые до
+        # этого момента чтения в кэш уже не попадут
+        with self._lock:
+            if self._pending is None:
+                self._entries.clear()
+            else:
+                for key in self._pending:
+                    self._entries.pop(key, None)
+            self._pending = set()
+            self.generation += 1
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -1,82 +1,644 @@
+import base64
+import json
+import queue
+import re
 import sqlite3
+import sys
+import threading
+from collections import namedtuple
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from database.cache import LRUCache
+from database.statements import StatementCompiler
 from models.task import Task
 from models.project import Project
 from models.user import User
-from datetime import datetime
+from models.task_frame import MISSING_ID, STATUS_CODES, UNKNOWN_STATUS, TaskFrame
+from datetime import datetime, timedelta, timezone
+
+# Вторичные индексы: (имя, таблица, колонки).
+# Покрывают выборки по внешним ключам и сортировку ORDER BY created_at DESC
+INDEXES = (
+    ("idx_tasks_project_created", "tasks", "project_id, created_at"),
+    ("idx_tasks_assignee_created", "tasks", "assignee_id, created_at"),
+    ("idx_tasks_status_due", "tasks", "status, due_date"),
+    ("idx_tasks_created", "tasks", "created_at"),
+    ("idx_projects_created", "projects", "created_at"),
+    ("idx_users_registration", "users", "registration_date"),
+)
+
+# Статусы задач; "открытые" - все, кроме завершенных
+TASK_STATUSES = ('pending', 'in_progress', 'completed')
+OPEN_TASK_STATUSES = ('pending', 'in_progress')
+
+# Полнотекстовый индекс задач (FTS5 с внешним содержимым) и триггеры синхронизации
+FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts
+USING fts5(title, description, content='tasks', content_rowid='id')
+"""
+
+FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+)
+
+# Слово FTS-запроса: буквы и цифры; подчеркивание, как и в unicode61, - разделитель
+_FTS_WORD = re.compile(r"[^\W_]+")
+
+
+# Именованные профили производительности SQLite.
+# durable - WAL без потери надежности (fsync на каждый коммит),
+# throughput - WAL + synchronous=NORMAL, большой кэш и mmap для интенсивной записи,
+# readonly-analytics - максимальный кэш и mmap под тяжелые читающие запросы
+PRAGMA_PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "readonly-analytics": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -256000,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+}
+
+# Порядок важен: journal_mode переключается первым
+PRAGMA_NAMES = (
+    "journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout"
+)
+
+# PRAGMA synchronous / temp_store возвращают числа - переводим обратно в имена
+_PRAGMA_VALUE_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+}
+
+# Фиксированный порядок колонок: строки читаются кортежами и разбираются по позиции
+TASK_COLUMNS = (
+    "id", "title", "description", "priority", "status",
+    "due_date", "project_id", "assignee_id", "created_at"
+)
+PROJECT_COLUMNS = ("id", "name", "description", "start_date", "end_date", "status", "created_at")
+USER_COLUMNS = ("id", "username", "email", "role", "registration_date")
+
+TASK_SELECT = "SELECT " + ", ".join(f"tasks.{column}" for column in TASK_COLUMNS) + " FROM tasks"
+PROJECT_SELECT = "SELECT " + ", ".join(PROJECT_COLUMNS) + " FROM projects"
+USER_SELECT = "SELECT " + ", ".join(USER_COLUMNS) + " FROM users"
+
+# Строка списка задач с уже подставленными названием проекта и именем исполнителя
+TaskListingRow = namedtuple("TaskListingRow", (
+    "id", "title", "description", "priority", "status", "due_date", "created_at",
+    "project_id", "project_name", "assignee_id", "assignee_name"
+))
+
+TASK_LISTING_SELECT = """
+SELECT tasks.id, tasks.title, tasks.description, tasks.priority, tasks.status,
+       tasks.due_date, tasks.created_at,
+       tasks.project_id, projects.name,
+       tasks.assignee_id, users.username
+FROM tasks
+LEFT JOIN projects ON projects.id = tasks.project_id
+LEFT JOIN users ON users.id = tasks.assignee_id
+"""
+
+# Допустимые фильтры get_task_listing -> условие WHERE
+TASK_LISTING_FILTERS = {
+    "project_id": "tasks.project_id = ?",
+    "assignee_id": "tasks.assignee_id = ?",
+    "status": "tasks.status = ?",
+}
+
+# Колонки, по которым update_*_where принимает фильтр вместо списка id
+UPDATE_FILTERS = {
+    "tasks": ("project_id", "assignee_id", "status"),
+    "projects": ("status",),
+    "users": ("role",),
+}
+
+# Колонки TaskFrame считаются в SQL сразу числами: статус - кодом, даты -
+# секундами от эпохи (через julianday), так что строки не разбираются в Python
+_STATUS_CODE_SQL = "CASE status {} ELSE {} END".format(
+    " ".join(f"WHEN '{status}' THEN {code}" for code, status in enumerate(STATUS_CODES)),
+    UNKNOWN_STATUS
+)
+_EPOCH_SQL = {
+    "iso": "COALESCE((julianday({0}) - 2440587.5) * 86400.0, 0.0)",
+    "epoch": "COALESCE({0} / 1000000.0, 0.0)",
+}
+TASK_FRAME_SELECT = {
+    mode: f"""
+SELECT id, priority, {_STATUS_CODE_SQL},
+       COALESCE(project_id, {MISSING_ID}), COALESCE(assignee_id, {MISSING_ID}),
+       {epoch_sql.format('due_date')}, {epoch_sql.format('created_at')}
+FROM tasks
+"""
+    for mode, epoch_sql in _EPOCH_SQL.items()
+}
+
+# Хранение меток времени:
+# iso - строки стандартного адаптера sqlite3 (по умолчанию),
+# epoch - целые микросекунды от эпохи: сравнения по датам идут как по числам,
+# а при чтении не разбираются строки.
+# Значения - (объявленный тип колонки, значение по умолчанию)
+TIMESTAMP_MODES = {
+    "iso": ("DATETIME", "CURRENT_TIMESTAMP"),
+    "epoch": ("EPOCH_US", "(CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER))"),
+}
+
+# Колонки с метками времени - их переводит миграция в режим epoch
+TIMESTAMP_COLUMNS = {
+    "users": ("registration_date",),
+    "projects": ("start_date", "end_date", "created_at"),
+    "tasks": ("due_date", "created_at"),
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_epoch(value: datetime) -> int:
+    # Наивные datetime считаются как есть (как и в режиме iso), aware - переводятся в UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def epoch_to_datetime(value) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+# Конвертер для объявленного типа EPOCH_US: соединения, открытые с
+# detect_types=sqlite3.PARSE_DECLTYPES, сразу получают datetime
+sqlite3.register_converter("EPOCH_US", epoch_to_datetime)
+
+
+@lru_cache(maxsize=65536)
+def _parse_datetime(value) -> datetime:
+    # Метки времени сильно повторяются (пакетные вставки, одинаковые сроки),
+    # поэтому разбор строки кэшируется; datetime неизменяем - объект можно разделять.
+    # В режиме epoch из базы приходят целые микросекунды
+    if isinstance(value, int):
+        return _EPOCH + timedelta(microseconds=value)
+    return datetime.fromisoformat(value)
+
 
 class DatabaseManager:
-    def __init__(self, db_path="tasks.db") -> None:
+    def __init__(self, db_path="tasks.db", profile=None, pragmas=None, pool_size=None,
+                 cache_size=256, cache_ttl=None, timestamps=None) -> None:
+        if timestamps is not None and timestamps not in TIMESTAMP_MODES:
+            raise ValueError(
+                f"Неизвестный режим меток времени: {timestamps}. "
+                f"Допустимые: {list(TIMESTAMP_MODES)}"
+            )
+        
         self.db_path = db_path
+        # None - режим берется из существующего файла (iso для новой базы)
+        self.timestamps = timestamps
         self.connection = None
+        self.pool_size = pool_size
+        self._pool = None
+        self._write_lock = threading.RLock()  # Запись всегда идет через одно соединение
+        self._tx_depth = 0  # Глубина вложенности transaction()
+        self._tx_thread = None  # Поток, владеющий открытой transaction()
+        self.fts_enabled = False  # Выставляется в create_tables, если SQLite собран с FTS5
+        self._local = threading.local()  # Проверка отмены чтений (cancellable) - своя у потока
+        
+        # Identity map для редко меняющихся проектов и пользователей
+        self.project_cache = LRUCache(cache_size, cache_ttl)
+        self.user_cache = LRUCache(cache_size, cache_ttl)
+        self.pragmas = self._resolve_pragmas(profile, pragmas)
+        
+        if pool_size is not None:
+            if pool_size < 1:
+                raise ValueError("Размер пула должен быть положительным")
+            if db_path == ":memory:":
+                raise ValueError("Пул соединений не поддерживается для базы :memory:")
+            # Параллельное чтение во время записи возможно только в режиме WAL
+            self.pragmas.setdefault("journal_mode", "WAL")
+        
         self.connect()
         self.create_tables()
 
     def connect(self) -> None:
         
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.row_factory = sqlite3.Row  # Чтобы получать строки как словари
+        # В режиме пула соединение записи используется из разных потоков под _write_lock
+        self.connection = self._open_connection(check_same_thread=self.pool_size is None)
+        # Запросы частичного обновления компилируются по схеме соединения записи
+        self.statements = StatementCompiler(self.connection)
+        
+        if self.pool_size is not None:
+            self._pool = queue.LifoQueue(maxsize=self.pool_size)
+            for _ in range(self.pool_size):
+                self._pool.put(self._open_connection(check_same_thread=False))
+
+    def _open_connection(self, check_same_thread=True) -> sqlite3.Connection:
+        
+        connection = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        # Строки - обычные кортежи: модели собираются по позициям колонок *_COLUMNS
+        connection.row_factory = None
+        self._apply_pragmas(connection)
+        return connection
+
+    @staticmethod
+    def _resolve_pragmas(profile, pragmas) -> dict:
+        
+        resolved = {}
+        if profile is not None:
+            if profile not in PRAGMA_PROFILES:
+                raise ValueError(
+                    f"Неизвестный профиль: {profile}. Допустимые: {list(PRAGMA_PROFILES)}"
+                )
+            resolved.update(PRAGMA_PROFILES[profile])
+        
+        # Явно переданные pragmas перекрывают значения профиля
+        for name, value in (pragmas or {}).items():
+            if name not in PRAGMA_NAMES:
+                raise ValueError(
+                    f"Неподдерживаемая PRAGMA: {name}. Допустимые: {list(PRAGMA_NAMES)}"
+                )
+            if not isinstance(value, int) and not str(value).replace("-", "").isalnum():
+                raise ValueError(f"Некорректное значение PRAGMA {name}: {value}")
+            resolved[name] = value
+        
+        return {name: resolved[name] for name in PRAGMA_NAMES if name in resolved}
+
+    def _apply_pragmas(self, connection) -> None:
+        
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+
+    def get_pragmas(self) -> dict:
+        
+        # Фактические значения, прочитанные из соединения
+        effective = {}
+        for name in PRAGMA_NAMES:
+            row = self.connection.execute(f"PRAGMA {name}").fetchone()
+            value = row[0] if row else None  # mmap_size недоступен для :memory:
+            effective[name] = _PRAGMA_VALUE_NAMES.get(name, {}).get(value, value)
+        return effective
+
+    @contextmanager
+    def transaction(self):
+        
+        # Единица работы: внутри блока методы не коммитят по отдельности,
+        # фиксация (или откат) выполняется один раз на выходе.
+        # Вложенные блоки оформляются как SAVEPOINT
+        with self._write_lock:
+            savepoint = self._begin_transaction()
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._rollback_transaction(savepoint)
+                raise
+            else:
+                self._commit_transaction(savepoint)
+            finally:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._tx_thread = None
+
+    def _begin_transaction(self) -> str | None:
+        
+        # Внешний блок открывает транзакцию, вложенный - SAVEPOINT (его имя возвращается)
+        if self._tx_depth:
+            savepoint = f"sp_{self._tx_depth}"
+            self.connection.execute(f"SAVEPOINT {savepoint}")
+            return savepoint
+        
+        if not self.connection.in_transaction:
+            self.connection.execute("BEGIN")
+        self._tx_thread = threading.get_ident()
+        return None
+
+    def _rollback_transaction(self, savepoint) -> None:
+        
+        if savepoint:
+            self.connection.execute(f"ROLLBACK TO {savepoint}")
+            self.connection.execute(f"RELEASE {savepoint}")
+        else:
+            self.connection.rollback()
+        # В кэш могли попасть откаченные изменения
+        self.clear_caches()
+
+    def _commit_transaction(self, savepoint) -> None:
+        
+        if savepoint:
+            self.connection.execute(f"RELEASE {savepoint}")
+        else:
+            self.connection.commit()
+            self._committed()
+
+    @contextmanager
+    def _write(self):
+        
+        # Коммит после операции только вне transaction()
+        with self._write_lock:
+            try:
+                yield self.connection
+            except BaseException:
+                if not self._tx_depth:
+                    self.connection.rollback()
+                raise
+            if not self._tx_depth:
+                self.connection.commit()
+                self._committed()
+
+    @contextmanager
+    def _read(self):
+        
+        # Без пула и внутри собственной транзакции (чтобы видеть свои
+        # незафиксированные изменения) читаем через основное соединение
+        pooled = self._pool is not None and self._tx_thread != threading.get_ident()
+        connection = self._acquire_pooled() if pooled else self.connection
+        
+        cancel_check = getattr(self._local, "cancel_check", None)
+        if cancel_check is not None:
+            connection.set_progress_handler(*cancel_check)
+        try:
+            yield connection
+        finally:
+            # Вложенное чтение (например, внутри незавершенного iter_*) не снимает
+            # handler и не возвращает соединение - это делает внешнее
+            outermost = not pooled or self._release_pooled()
+            if cancel_check is not None and outermost:
+                connection.set_progress_handler(None, 0)
+
+    def _acquire_pooled(self) -> sqlite3.Connection:
+        
+        # Соединение пула закреплено за потоком на время всех его вложенных чтений:
+        # приостановленный генератор iter_* держит соединение, и второе чтение
+        # того же потока при pool_size=1 иначе ждало бы его в очереди вечно
+        depth = getattr(self._local, "pool_depth", 0)
+        if depth == 0:
+            self._local.pool_connection = self._pool.get()
+        self._local.pool_depth = depth + 1
+        return self._local.pool_connection
+
+    def _release_pooled(self) -> bool:
+        
+        # True - соединение возвращено в пул (это было внешнее чтение потока)
+        self._local.pool_depth -= 1
+        if self._local.pool_depth:
+            return False
+        self._pool.put(self._local.pool_connection)
+        self._local.pool_connection = None
+        return True
+
+    @contextmanager
+    def cancellable(self, is_cancelled, interval=1000):
+        
+        # Чтения текущего потока внутри блока прерываются (sqlite3.OperationalError
+        # "interrupted"), как только is_cancelled() вернет истину. Проверка
+        # выполняется progress handler'ом SQLite каждые interval инструкций VM,
+        # поэтому отменяется и уже идущий долгий запрос
+        previous = getattr(self._local, "cancel_check", None)
+        self._local.cancel_check = (is_cancelled, interval)
+        try:
+            yield self
+        finally:
+            self._local.cancel_check = previous
+
+    def _adapt(self, value):
+        
+        # В режиме epoch datetime пишется целыми микросекундами. Глобальный
+        # sqlite3.register_adapter(datetime, ...) не подходит: он поменял бы
+        # формат и для баз в режиме iso в том же процессе
+        if self.timestamps == "epoch" and isinstance(value, datetime):
+            return datetime_to_epoch(value)
+        return value
+
+    def get_cache_stats(self) -> dict:
+        
+        return {'projects': self.project_cache.stats(), 'users': self.user_cache.stats()}
+
+    def clear_caches(self) -> None:
+        
+        self.project_cache.clear()
+        self.user_cache.clear()
+
+    def _committed(self) -> None:
+        
+        # Инвалидация внутри транзакции происходит до коммита, и читатель из
+        # пула мог успеть положить в кэш старую строку - после коммита
+        # инвалидированные ключи удаляются еще раз
+        self.project_cache.commit()
+        self.user_cache.commit()
 
     def close(self) -> None:
        
         if self.connection:
             self.connection.close()
+        
+        if self._pool is not None:
+            while not self._pool.empty():
+                self._pool.get_nowait().close()
 
     def create_tables(self) -> None:
         
+        stored = self._stored_timestamps()
+        if self.timestamps is None:
+            self.timestamps = stored or "iso"
+        elif stored == "iso" and self.timestamps == "epoch":
+            self.migrate_to_epoch()
+        elif stored == "epoch" and self.timestamps == "iso":
+            raise ValueError("База уже хранит метки времени в режиме epoch")
+        
         self._create_user_table()
         self._create_project_table()
         self._create_task_table()
+        self._create_indexes()
+        self._create_search_index()
 
-    def _create_user_table(self) -> None:
+    def _create_user_table(self, table="users") -> None:
         
         query = """
-        CREATE TABLE IF NOT EXISTS users (
+        CREATE TABLE IF NOT EXISTS {table} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
             email TEXT UNIQUE NOT NULL,
             role TEXT NOT NULL,
-            registration_date DATETIME DEFAULT CURRENT_TIMESTAMP
+            registration_date {ts_type} DEFAULT {ts_default}
         )
         """
-        self.connection.execute(query)
-        self.connection.commit()
+        self._create_table(query, table)
 
-    def _create_project_table(self) -> None:
+    def _create_project_table(self, table="projects") -> None:
         
         query = """
-        CREATE TABLE IF NOT EXISTS projects (
+        CREATE TABLE IF NOT EXISTS {table} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             description TEXT,
-            start_date DATETIME NOT NULL,
-            end_date DATETIME NOT NULL,
+            start_date {ts_type} NOT NULL,
+            end_date {ts_type} NOT NULL,
             status TEXT DEFAULT 'active',
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            created_at {ts_type} DEFAULT {ts_default}
         )
         """
-        self.connection.execute(query)
-        self.connection.commit()
+        self._create_table(query, table)
 
-    def _create_task_table(self) -> None:
+    def _create_task_table(self, table="tasks") -> None:
         
         query = """
-        CREATE TABLE IF NOT EXISTS tasks (
+        CREATE TABLE IF NOT EXISTS {table} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             description TEXT,
             priority INTEGER NOT NULL,
             status TEXT DEFAULT 'pending',
-            due_date DATETIME NOT NULL,
+            due_date {ts_type} NOT NULL,
             project_id INTEGER,
             assignee_id INTEGER,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            created_at {ts_type} DEFAULT {ts_default},
             FOREIGN KEY (project_id) REFERENCES projects (id),
             FOREIGN KEY (assignee_id) REFERENCES users (id)
         )
         """
-        self.connection.execute(query)
+        self._create_table(query, table)
+
+    def _create_table(self, query, table) -> None:
+        
+        ts_type, ts_default = TIMESTAMP_MODES[self.timestamps]
+        with self._write() as connection:
+            connection.execute(query.format(table=table, ts_type=ts_type, ts_default=ts_default))
+
+    def _stored_timestamps(self) -> str | None:
+        
+        # Режим существующего файла определяется по объявленному типу tasks.due_date
+        row = self.connection.execute(
+            "SELECT type FROM pragma_table_info('tasks') WHERE name = 'due_date'"
+        ).fetchone()
+        if row is None:
+            return None
+        return "epoch" if row[0].upper() == TIMESTAMP_MODES["epoch"][0] else "iso"
+
+    def migrate_to_epoch(self) -> None:
+        
+        # SQLite не меняет тип колонки через ALTER TABLE, поэтому каждая таблица
+        # пересоздается: копия в новой схеме, перенос строк с переводом дат,
+        # удаление старой и переименование. id и счетчик AUTOINCREMENT сохраняются.
+        # Индексы и триггеры FTS удаляются вместе со старой таблицей и
+        # создаются заново в конце миграции
+        self.timestamps = "epoch"
+        creators = {
+            "users": self._create_user_table,
+            "projects": self._create_project_table,
+            "tasks": self._create_task_table,
+        }
+        with self.transaction() as db:
+            for table, create in creators.items():
+                self._rebuild_table_epoch(table, create)
+            
+            if self.fts_enabled or db.connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+            ).fetchone():
+                db.connection.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+        
+        self._create_indexes()
+        self._create_search_index()
+        self.statements.reset()
+        self.clear_caches()
+
+    def _rebuild_table_epoch(self, table, create) -> None:
+        
+        # Копия таблицы в схеме epoch под именем {table}_epoch, перенос строк
+        # с переводом ISO-строк в микросекунды и замена старой таблицы
+        connection = self.connection
+        columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+        converted = [columns.index(name) for name in TIMESTAMP_COLUMNS[table]]
+        create(f"{table}_epoch")
+        
+        def convert(row):
+            row = list(row)
+            for index in converted:
+                if isinstance(row[index], str):
+                    row[index] = datetime_to_epoch(datetime.fromisoformat(row[index]))
+            return row
+        
+        column_list = ", ".join(columns)
+        placeholders = ", ".join(["?"] * len(columns))
+        connection.executemany(
+            f"INSERT INTO {table}_epoch ({column_list}) VALUES ({placeholders})",
+            map(convert, connection.execute(f"SELECT {column_list} FROM {table}"))
+        )
+        
+        sequence = connection.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+        ).fetchone()
+        connection.execute(f"DROP TABLE {table}")
+        connection.execute(f"ALTER TABLE {table}_epoch RENAME TO {table}")
+        if sequence is not None:
+            connection.execute(
+                "UPDATE sqlite_sequence SET seq = ? WHERE name = ?", (sequence[0], table)
+            )
+
+    def _create_indexes(self) -> None:
+        # IF NOT EXISTS: индексы досоздаются и в уже существующих файлах БД
+        for name, table, columns in INDEXES:
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+            )
         self.connection.commit()
 
+    def _create_search_index(self) -> None:
+        
+        exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+        ).fetchone()
+        
+        try:
+            self.connection.execute(FTS_TABLE)
+        except sqlite3.OperationalError:
+            # SQLite без FTS5 - search_tasks работает через LIKE
+            self.fts_enabled = False
+            return
+        
+        for trigger in FTS_TRIGGERS:
+            self.connection.execute(trigger)
+        
+        # Индекс появился в уже заполненной базе - строим его по текущим задачам
+        if not exists:
+            self.connection.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+        
+        self.connection.commit()
+        self.fts_enabled = True
+
    
 
     def add_task(self, task: Task) -> int:
@@ -85,18 +647,29 @@ class DatabaseManager:
         INSERT INTO tasks (title, description, priority, status, due_date, project_id, assignee_id)
         VALUES (?, ?, ?, ?, ?, ?, ?)
         """
-        cursor = self.connection.execute(query, (
-            task.title, task.description, task.priority, task.status,
-            task.due_date, task.project_id, task.assignee_id
-        ))
-        self.connection.commit()
+        with self._write() as connection:
+            cursor = connection.execute(query, (
+                task.title, task.description, task.priority, task.status,
+                self._adapt(task.due_date), task.project_id, task.assignee_id
+            ))
         task.id = cursor.lastrowid
         return task.id
 
+    def add_tasks_bulk(self, tasks, chunk_size=500) -> list[int]:
+        
+        columns = (
+            "title", "description", "priority", "status", "due_date", "project_id", "assignee_id"
+        )
+        return self._insert_bulk("tasks", columns, tasks, chunk_size, lambda task: (
+            task.title, task.description, task.priority, task.status,
+            self._adapt(task.due_date), task.project_id, task.assignee_id
+        ))
+
     def get_task_by_id(self, task_id) -> Task | None:
         
-        query = "SELECT * FROM tasks WHERE id = ?"
-        result = self.connection.execute(query, (task_id,)).fetchone()
+        query = f"{TASK_SELECT} WHERE id = ?"
+        with self._read() as connection:
+            result = connection.execute(query, (task_id,)).fetchone()
         
         if not result:
             return None
@@ -105,122 +678,376 @@ class DatabaseManager:
 
     def get_all_tasks(self) -> list[Task]:
         
-        query = "SELECT * FROM tasks ORDER BY created_at DESC"
-        results = self.connection.execute(query).fetchall()
+        query = f"{TASK_SELECT} ORDER BY created_at DESC"
+        with self._read() as connection:
+            results = connection.execute(query).fetchall()
         return [self._row_to_task(row) for row in results]
 
     def update_task(self, task_id, **kwargs) -> bool:
        
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        query = f"UPDATE tasks SET {set_clause} WHERE id = ?"
-        
-        values = list(kwargs.values())
-        values.append(task_id)
+        return self.update_tasks_where([task_id], **kwargs) > 0
+
+    def update_tasks_where(self, ids_or_filter, **fields) -> int:
         
-        self.connection.execute(query, values)
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        return self._update_where("tasks", ids_or_filter, fields)
 
     def delete_task(self, task_id) -> bool:
         
         query = "DELETE FROM tasks WHERE id = ?"
-        self.connection.execute(query, (task_id,))
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        with self._write() as connection:
+            cursor = connection.execute(query, (task_id,))
+        return cursor.rowcount > 0
 
-    def search_tasks(self, query) -> list[Task]:
+    def search_tasks(self, query, limit=None) -> list[Task]:
         
-        search_query = f"%{query}%"
-        sql = """
-        SELECT * FROM tasks 
-        WHERE title LIKE ? OR description LIKE ?
-        ORDER BY created_at DESC
-        """
-        results = self.connection.execute(sql, (search_query, search_query)).fetchall()
+        # LIMIT -1 в SQLite означает "без ограничения"
+        limit = -1 if limit is None else limit
+        
+        if self.fts_enabled:
+            match = self._fts_match_query(query)
+            if match is None:
+                return []
+            
+            # Префиксный поиск по каждому слову, сортировка по релевантности bm25
+            sql = f"""
+            {TASK_SELECT}
+            JOIN tasks_fts ON tasks_fts.rowid = tasks.id
+            WHERE tasks_fts MATCH ?
+            ORDER BY bm25(tasks_fts), tasks.created_at DESC
+            LIMIT ?
+            """
+            params = (match, limit)
+        else:
+            search_query = f"%{query}%"
+            sql = f"""
+            {TASK_SELECT}
+            WHERE title LIKE ? OR description LIKE ?
+            ORDER BY created_at DESC
+            LIMIT ?
+            """
+            params = (search_query, search_query, limit)
+        
+        with self._read() as connection:
+            results = connection.execute(sql, params).fetchall()
         return [self._row_to_task(row) for row in results]
 
+    @staticmethod
+    def _fts_match_query(query) -> str | None:
+        
+        # Слова запроса превращаются в префиксные термы "слово"*,
+        # служебный синтаксис FTS5 (кавычки, операторы) в запрос не попадает
+        words = _FTS_WORD.findall(query)
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
     def get_tasks_by_project(self, project_id) -> list[Task]:
         
-        query = "SELECT * FROM tasks WHERE project_id = ? ORDER BY created_at DESC"
-        results = self.connection.execute(query, (project_id,)).fetchall()
+        query = f"{TASK_SELECT} WHERE project_id = ? ORDER BY created_at DESC"
+        with self._read() as connection:
+            results = connection.execute(query, (project_id,)).fetchall()
         return [self._row_to_task(row) for row in results]
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
         
-        query = "SELECT * FROM tasks WHERE assignee_id = ? ORDER BY created_at DESC"
-        results = self.connection.execute(query, (user_id,)).fetchall()
+        query = f"{TASK_SELECT} WHERE assignee_id = ? ORDER BY created_at DESC"
+        with self._read() as connection:
+            results = connection.execute(query, (user_id,)).fetchall()
         return [self._row_to_task(row) for row in results]
 
+    def get_tasks_page(self, limit=50, cursor=None,
+                       project_id=None, assignee_id=None) -> tuple[list[Task], str | None]:
+        
+        conditions = []
+        params = []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if assignee_id is not None:
+            conditions.append("assignee_id = ?")
+            params.append(assignee_id)
+        
+        return self._fetch_page(
+            TASK_SELECT, TASK_COLUMNS, "tasks", "created_at",
+            conditions, params, limit, cursor, self._row_to_task
+        )
+
+    def get_task_listing(self, filters=None, limit=None,
+                         cursor=None) -> tuple[list[TaskListingRow], str | None]:
+        
+        # Один запрос с LEFT JOIN вместо отдельных запросов проекта и
+        # исполнителя на каждую задачу. Фильтр ids - список id задач,
+        # query - текстовый поиск по названию и описанию
+        conditions, params = self._task_listing_conditions(filters)
+        return self._fetch_page(
+            TASK_LISTING_SELECT, TaskListingRow._fields, "tasks", "created_at",
+            conditions, params, limit, cursor, self._row_to_listing_row
+        )
+
+    def get_task_listing_window(self, offset, limit, filters=None) -> list[TaskListingRow]:
+        
+        # Окно строк списка начиная с позиции offset (для виртуального списка).
+        # Ключ строки перед окном ищется по индексу (created_at, id) без JOIN,
+        # само окно читается keyset-запросом - как страница get_task_listing
+        cursor = None
+        if offset > 0:
+            conditions, params = self._task_listing_conditions(filters)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+            SELECT tasks.created_at, tasks.id FROM tasks
+            {where}
+            ORDER BY tasks.created_at DESC, tasks.id DESC
+            LIMIT 1 OFFSET ?
+            """
+            with self._read() as connection:
+                row = connection.execute(query, (*params, offset - 1)).fetchone()
+            if row is None:
+                return []
+            cursor = self._encode_cursor(*row)
+        
+        rows, _ = self.get_task_listing(filters, limit=limit, cursor=cursor)
+        return rows
+
+    def count_task_listing(self, filters=None) -> int:
+        
+        conditions, params = self._task_listing_conditions(filters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._read() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+
+    def _task_listing_conditions(self, filters) -> tuple[list, list]:
+        
+        conditions = []
+        params = []
+        for name, value in (filters or {}).items():
+            if name == "ids":
+                ids = list(value)
+                conditions.append(f"tasks.id IN ({', '.join(['?'] * len(ids)) or 'NULL'})")
+                params.extend(ids)
+            elif name == "query":
+                condition, query_params = self._listing_query_condition(value)
+                conditions.append(condition)
+                params.extend(query_params)
+            elif name in TASK_LISTING_FILTERS:
+                conditions.append(TASK_LISTING_FILTERS[name])
+                params.append(value)
+            else:
+                raise ValueError(f"Неизвестный фильтр: {name}")
+        return conditions, params
+
+    def _listing_query_condition(self, query) -> tuple[str, list]:
+        
+        # Текстовый поиск с той же семантикой, что у search_tasks
+        if not self.fts_enabled:
+            return "(tasks.title LIKE ? OR tasks.description LIKE ?)", [f"%{query}%"] * 2
+        match = self._fts_match_query(query)
+        if match is None:
+            return "0", []
+        return "tasks.id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)", [match]
+
+    def iter_tasks(self, project_id=None, assignee_id=None, batch_size=500) -> Iterator[Task]:
+        
+        conditions = []
+        params = []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if assignee_id is not None:
+            conditions.append("assignee_id = ?")
+            params.append(assignee_id)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"{TASK_SELECT} {where} ORDER BY created_at DESC"
+        return self._iter_rows(query, params, self._row_to_task, batch_size)
+
+    def get_task_frame(self, project_id=None, assignee_id=None, batch_size=5000) -> TaskFrame:
+        
+        # Колоночное представление задач без создания объекта на строку
+        conditions = []
+        params = []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if assignee_id is not None:
+            conditions.append("assignee_id = ?")
+            params.append(assignee_id)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"{TASK_FRAME_SELECT[self.timestamps]} {where} ORDER BY id"
+        return TaskFrame.from_rows(self._iter_rows(query, params, tuple, batch_size))
+
+    def get_tasks_by_ids(self, task_ids, chunk_size=500) -> list[Task]:
+        
+        # Порядок результата - по id; отсутствующие id пропускаются
+        task_ids = list(task_ids)
+        tasks = []
+        with self._read() as connection:
+            for start in range(0, len(task_ids), chunk_size):
+                chunk = task_ids[start:start + chunk_size]
+                query = f"{TASK_SELECT} WHERE id IN ({', '.join(['?'] * len(chunk))})"
+                tasks.extend(self._row_to_task(row) for row in connection.execute(query, chunk))
+        tasks.sort(key=lambda task: task.id)
+        return tasks
+
+    def count_tasks_by_project(self, by_status=False) -> dict:
+        
+        return self._count_tasks_grouped("project_id", by_status)
+
+    def count_tasks_by_user(self, by_status=False) -> dict:
+        
+        return self._count_tasks_grouped("assignee_id", by_status)
+
+    def count_tasks_for_project(self, project_id, status=None) -> int:
+        
+        return self._count_tasks_for("project_id", project_id, status)
+
+    def count_tasks_for_user(self, user_id, status=None) -> int:
+        
+        return self._count_tasks_for("assignee_id", user_id, status)
+
+    def get_overdue_tasks(self, now=None, include_completed=False, limit=None) -> list[Task]:
+        
+        # Фильтр status IN (...) AND due_date < ? идет по индексу (status, due_date)
+        statuses = TASK_STATUSES if include_completed else OPEN_TASK_STATUSES
+        query = f"""
+        {TASK_SELECT}
+        WHERE status IN ({', '.join(['?'] * len(statuses))}) AND due_date < ?
+        ORDER BY due_date
+        LIMIT ?
+        """
+        params = (*statuses, self._adapt(now or datetime.now()), -1 if limit is None else limit)
+        
+        with self._read() as connection:
+            results = connection.execute(query, params).fetchall()
+        return [self._row_to_task(row) for row in results]
+
+    def count_overdue_tasks(self, group_by, now=None, include_completed=False) -> dict:
+        
+        if group_by not in ('project_id', 'assignee_id'):
+            raise ValueError(f"Некорректная группировка: {group_by}")
+        
+        statuses = TASK_STATUSES if include_completed else OPEN_TASK_STATUSES
+        query = f"""
+        SELECT {group_by}, COUNT(*) FROM tasks
+        WHERE status IN ({', '.join(['?'] * len(statuses))}) AND due_date < ?
+        GROUP BY {group_by}
+        """
+        with self._read() as connection:
+            results = connection.execute(
+                query, (*statuses, self._adapt(now or datetime.now()))
+            ).fetchall()
+        return {row[0]: row[1] for row in results}
+
    
     def _row_to_task(self, row) -> Task:
         
-        task = Task(
-            title=row['title'],
-            description=row['description'],
-            priority=row['priority'],
-            due_date=datetime.fromisoformat(row['due_date']),
-            project_id=row['project_id'],
-            assignee_id=row['assignee_id']
-        )
-        task.id = row['id']
-        task.status = row['status']
-        task.created_at = datetime.fromisoformat(row['created_at'])
-        return task 
-    
+        # Быстрый путь: без Task.__init__ (он вызывает datetime.now() для
+        # created_at, которое тут же перезаписывается) - поля раскладываются
+        # из кортежа по позициям TASK_COLUMNS
+        task = Task.__new__(Task)
+        (task.id, task.title, task.description, task.priority, task.status,
+         due_date, task.project_id, task.assignee_id, created_at) = row
+        task.status = sys.intern(task.status)  # Общая строка статуса для всех задач
+        task.due_date = _parse_datetime(due_date)
+        task.created_at = _parse_datetime(created_at)
+        return task
+
     def add_project(self, project: Project) -> int:
         
         query = """
         INSERT INTO projects (name, description, start_date, end_date, status)
         VALUES (?, ?, ?, ?, ?)
         """
-        cursor = self.connection.execute(query, (
-            project.name, project.description, project.start_date,
-            project.end_date, project.status
-        ))
-        self.connection.commit()
+        with self._write() as connection:
+            cursor = connection.execute(query, (
+                project.name, project.description, self._adapt(project.start_date),
+                self._adapt(project.end_date), project.status
+            ))
         project.id = cursor.lastrowid
         return project.id
 
+    def add_projects_bulk(self, projects, chunk_size=500) -> list[int]:
+        
+        columns = ("name", "description", "start_date", "end_date", "status")
+        return self._insert_bulk("projects", columns, projects, chunk_size, lambda project: (
+            project.name, project.description, self._adapt(project.start_date),
+            self._adapt(project.end_date), project.status
+        ))
+
     def get_project_by_id(self, project_id) -> Project | None:
         
-        query = "SELECT * FROM projects WHERE id = ?"
-        result = self.connection.execute(query, (project_id,)).fetchone()
+        project = self.project_cache.get(project_id)
+        if project is not None:
+            return project
+        
+        # Поколение берется до SELECT: если запись успеет изменить строку,
+        # прочитанный объект не попадет в кэш
+        generation = self.project_cache.generation
+        query = f"{PROJECT_SELECT} WHERE id = ?"
+        with self._read() as connection:
+            result = connection.execute(query, (project_id,)).fetchone()
         
         if not result:
             return None
             
-        return self._row_to_project(result)
+        project = self._row_to_project(result)
+        self.project_cache.put(project_id, project, generation)
+        return project
 
     def get_all_projects(self) -> list[Project]:
        
-        query = "SELECT * FROM projects ORDER BY created_at DESC"
-        results = self.connection.execute(query).fetchall()
+        query = f"{PROJECT_SELECT} ORDER BY created_at DESC"
+        with self._read() as connection:
+            results = connection.execute(query).fetchall()
         return [self._row_to_project(row) for row in results]
 
+    def get_projects_page(self, limit=50, cursor=None) -> tuple[list[Project], str | None]:
+        
+        return self._fetch_page(
+            PROJECT_SELECT, PROJECT_COLUMNS, "projects", "created_at",
+            [], [], limit, cursor, self._row_to_project
+        )
+
+    def iter_projects(self, batch_size=500) -> Iterator[Project]:
+        
+        query = f"{PROJECT_SELECT} ORDER BY created_at DESC"
+        return self._iter_rows(query, (), self._row_to_project, batch_size)
+
     def update_project(self, project_id, **kwargs) -> bool:
         
-        if not kwargs:
-            return False
+        return self.update_projects_where([project_id], **kwargs) > 0
+
+    def update_projects_where(self, ids_or_filter, **fields) -> int:
         
-        set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        query = f"UPDATE projects SET {set_clause} WHERE id = ?"
+        return self._update_where("projects", ids_or_filter, fields, self.project_cache)
+
+    def get_project_task_stats(self, project_id=None) -> dict:
         
-        values = list(kwargs.values())
-        values.append(project_id)
+        # {project_id: (всего задач, завершено)} одним запросом с GROUP BY.
+        # LEFT JOIN оставляет в результате проекты без задач
+        query = """
+        SELECT projects.id, COUNT(tasks.id), COALESCE(SUM(tasks.status = 'completed'), 0)
+        FROM projects
+        LEFT JOIN tasks ON tasks.project_id = projects.id
+        {where}
+        GROUP BY projects.id
+        """
+        if project_id is None:
+            query, params = query.format(where=""), ()
+        else:
+            query, params = query.format(where="WHERE projects.id = ?"), (project_id,)
         
-        self.connection.execute(query, values)
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        with self._read() as connection:
+            results = connection.execute(query, params).fetchall()
+        return {row[0]: (row[1], row[2]) for row in results}
 
     def delete_project(self, project_id) -> bool:
        
         query = "DELETE FROM projects WHERE id = ?"
-        self.connection.execute(query, (project_id,))
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        with self._write() as connection:
+            cursor = connection.execute(query, (project_id,))
+            self.project_cache.invalidate(project_id)
+        return cursor.rowcount > 0
 
     # === МЕТОДЫ ДЛЯ РАБОТЫ С ПОЛЬЗОВАТЕЛЯМИ ===
 
@@ -230,73 +1057,335 @@ class DatabaseManager:
         INSERT INTO users (username, email, role)
         VALUES (?, ?, ?)
         """
-        cursor = self.connection.execute(query, (
-            user.username, user.email, user.role
-        ))
-        self.connection.commit()
+        with self._write() as connection:
+            cursor = connection.execute(query, (
+                user.username, user.email, user.role
+            ))
         user.id = cursor.lastrowid
         return user.id
 
+    def add_users_bulk(self, users, chunk_size=500) -> list[int]:
+        
+        columns = ("username", "email", "role")
+        return self._insert_bulk("users", columns, users, chunk_size, lambda user: (
+            user.username, user.email, user.role
+        ))
+
+    def add_users_skip_conflicts(self, users, chunk_size=500) -> list[int | None]:
+        
+        # Пользователи с уже занятыми username/email пропускаются, а не
+        # обрывают вставку: для каждого возвращается id или None при конфликте.
+        # RETURNING не работает с executemany, поэтому строки вставляются по одной,
+        # но с одним коммитом на пачку (внутри transaction() - на всю операцию)
+        query = """
+        INSERT INTO users (username, email, role) VALUES (?, ?, ?)
+        ON CONFLICT DO NOTHING
+        RETURNING id
+        """
+        ids = []
+        users = iter(users)
+        
+        while True:
+            chunk = list(islice(users, chunk_size))
+            if not chunk:
+                break
+            
+            with self._write() as connection:
+                for user in chunk:
+                    row = connection.execute(
+                        query, (user.username, user.email, user.role)
+                    ).fetchone()
+                    user.id = row[0] if row else None
+                    ids.append(user.id)
+        
+        return ids
+
     def get_user_by_id(self, user_id) -> User | None:
        
-        query = "SELECT * FROM users WHERE id = ?"
-        result = self.connection.execute(query, (user_id,)).fetchone()
+        user = self.user_cache.get(user_id)
+        if user is not None:
+            return user
+        
+        generation = self.user_cache.generation
+        query = f"{USER_SELECT} WHERE id = ?"
+        with self._read() as connection:
+            result = connection.execute(query, (user_id,)).fetchone()
         
         if not result:
             return None
             
-        return self._row_to_user(result)
+        user = self._row_to_user(result)
+        self.user_cache.put(user_id, user, generation)
+        return user
 
     def get_all_users(self) -> list[User]:
         
-        query = "SELECT * FROM users ORDER BY registration_date DESC"
-        results = self.connection.execute(query).fetchall()
+        query = f"{USER_SELECT} ORDER BY registration_date DESC"
+        with self._read() as connection:
+            results = connection.execute(query).fetchall()
         return [self._row_to_user(row) for row in results]
 
-    def update_user(self, user_id, **kwargs) -> bool:
-      
-        if not kwargs:
-            return False
+    def get_users_page(self, limit=50, cursor=None) -> tuple[list[User], str | None]:
         
-        set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        query = f"UPDATE users SET {set_clause} WHERE id = ?"
+        return self._fetch_page(
+            USER_SELECT, USER_COLUMNS, "users", "registration_date",
+            [], [], limit, cursor, self._row_to_user
+        )
+
+    def iter_users(self, batch_size=500) -> Iterator[User]:
         
-        values = list(kwargs.values())
-        values.append(user_id)
+        query = f"{USER_SELECT} ORDER BY registration_date DESC"
+        return self._iter_rows(query, (), self._row_to_user, batch_size)
+
+    def update_user(self, user_id, **kwargs) -> bool:
+      
+        return self.update_users_where([user_id], **kwargs) > 0
+
+    def update_users_where(self, ids_or_filter, **fields) -> int:
         
-        self.connection.execute(query, values)
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        return self._update_where("users", ids_or_filter, fields, self.user_cache)
 
     def delete_user(self, user_id) -> bool:
        
         query = "DELETE FROM users WHERE id = ?"
-        self.connection.execute(query, (user_id,))
-        self.connection.commit()
-        return self.connection.total_changes > 0
+        with self._write() as connection:
+            cursor = connection.execute(query, (user_id,))
+            self.user_cache.invalidate(user_id)
+        return cursor.rowcount > 0
 
     # === ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ===
 
+    def _count_tasks_grouped(self, column, by_status) -> dict:
+        
+        # {id: количество} или {id: {статус: количество}} одним GROUP BY,
+        # без загрузки самих задач; задачи без проекта/исполнителя не учитываются
+        if by_status:
+            query = f"""
+            SELECT {column}, status, COUNT(*) FROM tasks
+            WHERE {column} IS NOT NULL
+            GROUP BY {column}, status
+            """
+        else:
+            query = f"""
+            SELECT {column}, COUNT(*) FROM tasks
+            WHERE {column} IS NOT NULL
+            GROUP BY {column}
+            """
+        
+        with self._read() as connection:
+            results = connection.execute(query).fetchall()
+        
+        if not by_status:
+            return {row[0]: row[1] for row in results}
+        
+        counts = {}
+        for owner_id, status, count in results:
+            counts.setdefault(owner_id, {})[status] = count
+        return counts
+
+    def _update_where(self, table, ids_or_filter, fields, cache=None, chunk_size=500) -> int:
+        
+        # Один UPDATE на набор строк вместо запроса на каждый id.
+        # ids_or_filter - список id (разбивается на пачки по chunk_size
+        # из-за лимита параметров SQLite) или словарь фильтра по UPDATE_FILTERS;
+        # значение фильтра-списка превращается в IN (...).
+        # Возвращает точное число измененных строк (cursor.rowcount)
+        if not fields:
+            return 0
+        
+        # Колонки проверены по схеме и упорядочены - текст запроса для одного
+        # набора полей всегда одинаков и берется из кэша компилятора
+        columns = self.statements.update_columns(table, fields)
+        values = [self._adapt(fields[name]) for name in columns]
+        
+        if isinstance(ids_or_filter, dict):
+            where, params = self._update_filter_where(table, ids_or_filter)
+            query = self.statements.update(table, columns, where)
+            with self._write() as connection:
+                changed = connection.execute(query, values + params).rowcount
+                # Какие id затронуты, заранее неизвестно
+                if cache is not None:
+                    cache.clear()
+            return changed
+        
+        return self._update_ids(table, columns, values, list(ids_or_filter), cache, chunk_size)
+
+    def _update_ids(self, table, columns, values, ids, cache, chunk_size) -> int:
+        
+        changed = 0
+        with self._write() as connection:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                query = self.statements.update(
+                    table, columns, f"id IN ({', '.join(['?'] * len(chunk))})"
+                )
+                changed += connection.execute(query, values + chunk).rowcount
+                if cache is not None:
+                    for row_id in chunk:
+                        cache.invalidate(row_id)
+        return changed
+
+    @staticmethod
+    def _update_filter_where(table, filters) -> tuple:
+        
+        # Условие WHERE и параметры для словаря фильтра из UPDATE_FILTERS
+        conditions = []
+        params = []
+        for name, value in sorted(filters.items()):
+            if name not in UPDATE_FILTERS[table]:
+                raise ValueError(f"Неизвестный фильтр: {name}")
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                conditions.append(f"{name} IN ({', '.join(['?'] * len(value))})")
+                params.extend(value)
+            else:
+                conditions.append(f"{name} = ?")
+                params.append(value)
+        if not conditions:
+            raise ValueError("Пустой фильтр обновил бы все строки таблицы")
+        return " AND ".join(conditions), params
+
+    def _count_tasks_for(self, column, value, status) -> int:
+        
+        query = f"SELECT COUNT(*) FROM tasks WHERE {column} = ?"
+        params = [value]
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        
+        with self._read() as connection:
+            return connection.execute(query, params).fetchone()[0]
+
+    def _iter_rows(self, query, params, row_to_model, batch_size) -> Iterator:
+        
+        # Строки читаются пачками по batch_size и превращаются в объекты по одной,
+        # так что память не зависит от размера таблицы. Соединение (из пула)
+        # занято, пока генератор не исчерпан или не закрыт
+        if batch_size < 1:
+            raise ValueError("Размер пачки должен быть положительным")
+        
+        with self._read() as connection:
+            cursor = connection.execute(query, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row_to_model(row)
+            finally:
+                # Срабатывает и при досрочном выходе (break / close() генератора)
+                cursor.close()
+
+    def _fetch_page(self, select, columns, table, order_column, conditions, params,
+                    limit, cursor, row_to_model) -> tuple[list, str | None]:
+        
+        # Keyset-пагинация: вместо OFFSET продолжаем с позиции последней
+        # строки предыдущей страницы по (order_column, id) - поиск идет по индексу,
+        # поэтому любая страница стоит столько же, сколько первая.
+        # limit=None - все строки одной страницей
+        if limit is not None and limit < 1:
+            raise ValueError("Размер страницы должен быть положительным")
+        
+        conditions = list(conditions)
+        params = list(params)
+        if cursor is not None:
+            conditions.append(f"({table}.{order_column}, {table}.id) < (?, ?)")
+            params.extend(self._decode_cursor(cursor))
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+        {select}
+        {where}
+        ORDER BY {table}.{order_column} DESC, {table}.id DESC
+        LIMIT ?
+        """
+        # Лишняя строка показывает, есть ли следующая страница
+        params.append(-1 if limit is None else limit + 1)
+        
+        with self._read() as connection:
+            rows = connection.execute(query, params).fetchall()
+        
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = self._encode_cursor(
+                last[columns.index(order_column)], last[columns.index("id")]
+            )
+        
+        return [row_to_model(row) for row in rows], next_cursor
+
+    @staticmethod
+    def _encode_cursor(order_value, row_id) -> str:
+        
+        payload = json.dumps([order_value, row_id]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor) -> tuple:
+        
+        try:
+            order_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError, AttributeError):
+            raise ValueError(f"Некорректный курсор: {cursor}")
+        return order_value, row_id
+
+    def _insert_bulk(self, table, columns, items, chunk_size, to_params) -> list[int]:
+        
+        # Пачки по chunk_size строк: один executemany и один коммит на пачку
+        # (внутри transaction() - один общий коммит в конце).
+        # Таблицы объявлены с AUTOINCREMENT, поэтому внутри транзакции строки
+        # получают подряд идущие id, и последний из них лежит в sqlite_sequence
+        placeholders = ", ".join(["?"] * len(columns))
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        ids = []
+        items = iter(items)
+        
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                break
+            
+            with self._write() as connection:
+                connection.executemany(query, [to_params(item) for item in chunk])
+                last_id = connection.execute(
+                    "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+                ).fetchone()[0]
+            
+            first_id = last_id - len(chunk) + 1
+            for offset, item in enumerate(chunk):
+                item.id = first_id + offset
+                ids.append(item.id)
+        
+        return ids
+
+    def _row_to_listing_row(self, row) -> TaskListingRow:
+        
+        (task_id, title, description, priority, status, due_date, created_at,
+         project_id, project_name, assignee_id, assignee_name) = row
+        return TaskListingRow(
+            task_id, title, description, priority, status,
+            _parse_datetime(due_date), _parse_datetime(created_at),
+            project_id, project_name, assignee_id, assignee_name
+        )
+
     def _row_to_project(self, row) -> Project:
        
-        project = Project(
-            name=row['name'],
-            description=row['description'],
-            start_date=datetime.fromisoformat(row['start_date']),
-            end_date=datetime.fromisoformat(row['end_date'])
-        )
-        project.id = row['id']
-        project.status = row['status']
-        project.created_at = datetime.fromisoformat(row['created_at'])
+        project = Project.__new__(Project)
+        (project.id, project.name, project.description, start_date,
+         end_date, project.status, created_at) = row
+        project.status = sys.intern(project.status)
+        project.start_date = _parse_datetime(start_date)
+        project.end_date = _parse_datetime(end_date)
+        project.created_at = _parse_datetime(created_at)
         return project
 
     def _row_to_user(self, row) -> User:
         
-        user = User(
-            username=row['username'],
-            email=row['email'],
-            role=row['role']
-        )
-        user.id = row['id']
-        user.registration_date = datetime.fromisoformat(row['registration_date'])
-        return user
\ No newline at end of file
+        # Без User.__init__: данные из базы уже прошли валидацию при записи
+        user = User.__new__(User)
+        user.id, user.username, user.email, user.role, registration_date = row
+        user.role = sys.intern(user.role)
+        user.registration_date = _parse_datetime(registration_date)
+        return user
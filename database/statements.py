@@ -0,0 +1,49 @@
+import threading
+
+
+class StatementCompiler:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self._columns = {}  # Таблица -> реальные колонки (из PRAGMA table_info)
+        self._statements = {}  # (таблица, колонки SET, условие) -> готовый SQL
+        self._lock = threading.Lock()
+
+    def table_columns(self, table) -> frozenset:
+
+        columns = self._columns.get(table)
+        if columns is None:
+            rows = self.connection.execute(f"PRAGMA table_info({table})").fetchall()
+            if not rows:
+                raise ValueError(f"Неизвестная таблица: {table}")
+            columns = frozenset(row[1] for row in rows)
+            self._columns[table] = columns
+        return columns
+
+    def update_columns(self, table, fields) -> tuple:
+
+        # Имена колонок проверяются по схеме и сортируются: одинаковый набор
+        # полей в любом порядке дает один и тот же текст запроса
+        allowed = self.table_columns(table)
+        for name in fields:
+            if name == "id" or name not in allowed:
+                raise ValueError(f"Недопустимая колонка для обновления {table}: {name}")
+        return tuple(sorted(fields))
+
+    def update(self, table, columns, where) -> str:
+
+        # where собирается только из проверенных имен и плейсхолдеров
+        key = (table, columns, where)
+        statement = self._statements.get(key)
+        if statement is None:
+            set_clause = ", ".join(f"{name} = ?" for name in columns)
+            statement = f"UPDATE {table} SET {set_clause} WHERE {where}"
+            with self._lock:
+                self._statements[key] = statement
+        return statement
+
+    def reset(self) -> None:
+
+        # После изменения схемы (миграции) колонки перечитываются
+        with self._lock:
+            self._columns.clear()
+            self._statements.clear()
@@ -1,6 +1,9 @@
+import sys
 from datetime import datetime
 
 class Project:
+    __slots__ = ('id', 'name', 'description', 'start_date', 'end_date', 'status', 'created_at')
+
     def __init__(self, name, description, start_date, end_date) -> None:
         self.id = None  
         self.name = name
@@ -15,7 +18,7 @@ class Project:
         valid_statuses = ['active', 'completed', 'on_hold']
         
         if new_status in valid_statuses:
-            self.status = new_status
+            self.status = sys.intern(new_status)
             return True
         return False
 
@@ -1,6 +1,13 @@
+import sys
 from datetime import datetime
 
 class Task:
+    # Без __dict__ у каждого экземпляра: фиксированный набор полей
+    __slots__ = (
+        'id', 'title', 'description', 'priority', 'status',
+        'due_date', 'project_id', 'assignee_id', 'created_at'
+    )
+
     def __init__(self, title, description, priority, due_date, project_id, assignee_id) -> None:
         self.id = None  
         self.title = title
@@ -17,7 +24,8 @@ class Task:
         valid_statuses = ['pending', 'in_progress', 'completed']
         
         if new_status in valid_statuses:
-            self.status = new_status
+            # Один общий объект строки на статус вместо копии в каждой задаче
+            self.status = sys.intern(new_status)
             return True
         return False
 
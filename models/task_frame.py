@@ -0,0 +1,191 @@
+from array import array
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен - без него колонки хранятся в array
+    np = None
+
+# Статус хранится кодом - индексом в этом кортеже
+STATUS_CODES = ('pending', 'in_progress', 'completed')
+
+# Код статуса, которого нет в STATUS_CODES; в group_count он считается под ключом None
+UNKNOWN_STATUS = -1
+
+# Отсутствующий project_id / assignee_id
+MISSING_ID = -1
+
+# Колонки фрейма: имя -> typecode модуля array (и dtype NumPy)
+COLUMNS = {
+    'id': 'q',
+    'priority': 'b',
+    'status': 'b',
+    'project_id': 'q',
+    'assignee_id': 'q',
+    'due_date': 'd',    # секунды от эпохи
+    'created_at': 'd',  # секунды от эпохи
+}
+
+_DTYPES = {'q': 'int64', 'b': 'int8', 'd': 'float64'}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value) -> float:
+    # Наивные datetime переводятся так же, как julianday() в SQLite
+    return (value - _EPOCH).total_seconds()
+
+
+class TaskFrame:
+    def __init__(self, columns) -> None:
+        # columns: имя -> array / numpy.ndarray одинаковой длины
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows) -> 'TaskFrame':
+
+        # rows - итерируемое кортежей в порядке COLUMNS; значения уже числовые
+        buffers = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        appenders = [buffers[name].append for name in COLUMNS]
+        for row in rows:
+            for append, value in zip(appenders, row):
+                append(value)
+
+        if np is not None:
+            return cls({
+                name: np.frombuffer(buffer, dtype=_DTYPES[COLUMNS[name]]).copy()
+                for name, buffer in buffers.items()
+            })
+        return cls(buffers)
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    def column(self, name):
+
+        return self.columns[name]
+
+    def filter(self, priority=None, status=None, project_id=None, assignee_id=None,
+               due_before=None, due_after=None) -> 'TaskFrame':
+
+        # Скалярное значение - равенство, список/множество - вхождение
+        conditions = self._conditions(priority, status, project_id, assignee_id,
+                                      due_before, due_after)
+        if np is not None:
+            return self._take(np.nonzero(self._mask(conditions))[0])
+        return self._take(self._indices(conditions))
+
+    def _conditions(self, priority, status, project_id, assignee_id,
+                    due_before, due_after) -> list:
+
+        conditions = []
+        for name, value in (('priority', priority), ('project_id', project_id),
+                            ('assignee_id', assignee_id)):
+            if value is not None:
+                conditions.append((name, 'in', self._as_set(value)))
+        if status is not None:
+            conditions.append(('status', 'in', self._status_codes(status)))
+        if due_before is not None:
+            conditions.append(('due_date', '<', to_epoch(due_before)))
+        if due_after is not None:
+            conditions.append(('due_date', '>', to_epoch(due_after)))
+        return conditions
+
+    def _mask(self, conditions):
+
+        mask = np.ones(len(self), dtype=bool)
+        for name, op, value in conditions:
+            data = self.columns[name]
+            if op == 'in':
+                mask &= np.isin(data, list(value))
+            elif op == '<':
+                mask &= data < value
+            else:
+                mask &= data > value
+        return mask
+
+    def _indices(self, conditions) -> list:
+
+        # Без NumPy: последовательно сужаем список индексов
+        indices = range(len(self))
+        for name, op, value in conditions:
+            data = self.columns[name]
+            if op == 'in':
+                indices = [i for i in indices if data[i] in value]
+            elif op == '<':
+                indices = [i for i in indices if data[i] < value]
+            else:
+                indices = [i for i in indices if data[i] > value]
+        return list(indices)
+
+    def overdue(self, now=None, include_completed=False) -> 'TaskFrame':
+
+        statuses = STATUS_CODES if include_completed else ('pending', 'in_progress')
+        return self.filter(status=statuses, due_before=now or datetime.now())
+
+    def group_count(self, name) -> dict:
+
+        data = self.columns[name]
+        if np is not None:
+            values, counts = np.unique(data, return_counts=True)
+            result = dict(zip(values.tolist(), counts.tolist()))
+        else:
+            result = {}
+            for value in data:
+                result[value] = result.get(value, 0) + 1
+
+        if name == 'status':
+            # Отрицательный код нельзя использовать как индекс: STATUS_CODES[-1]
+            # дал бы 'completed' и затер настоящий счетчик
+            return {
+                STATUS_CODES[code] if code != UNKNOWN_STATUS else None: count
+                for code, count in result.items()
+            }
+        return result
+
+    def sort(self, name, descending=False) -> 'TaskFrame':
+
+        data = self.columns[name]
+        if np is not None:
+            if not descending:
+                return self._take(np.argsort(data, kind='stable'))
+            # Обратный порядок с сохранением порядка равных, как у sorted(reverse=True):
+            # устойчивая сортировка перевернутой колонки, затем разворот и пересчет индексов
+            order = np.argsort(data[::-1], kind='stable')[::-1]
+            return self._take(len(data) - 1 - order)
+
+        order = sorted(range(len(data)), key=data.__getitem__, reverse=descending)
+        return self._take(order)
+
+    def to_tasks(self, db_manager) -> list:
+
+        # Объекты Task создаются только по запросу, в порядке строк фрейма
+        ids = self.columns['id'].tolist()
+        tasks = {task.id: task for task in db_manager.get_tasks_by_ids(ids)}
+        return [tasks[task_id] for task_id in ids if task_id in tasks]
+
+    def _take(self, indices) -> 'TaskFrame':
+
+        if np is not None:
+            return TaskFrame({name: data[indices] for name, data in self.columns.items()})
+        return TaskFrame({
+            name: array(data.typecode, [data[i] for i in indices])
+            for name, data in self.columns.items()
+        })
+
+    @classmethod
+    def _status_codes(cls, status) -> set:
+
+        codes = set()
+        for name in cls._as_set(status):
+            if name not in STATUS_CODES:
+                raise ValueError(f"Неизвестный статус: {name}. Допустимые: {list(STATUS_CODES)}")
+            codes.add(STATUS_CODES.index(name))
+        return codes
+
+    @staticmethod
+    def _as_set(value) -> set:
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return set(value)
+        return {value}
@@ -1,7 +1,14 @@
 from datetime import datetime
 import re
+import sys
+
+# Шаблон компилируется один раз на модуль, а не на каждую проверку
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+VALID_ROLES = ('admin', 'manager', 'developer')
 
 class User:
+    __slots__ = ('id', 'username', 'email', 'role', 'registration_date')
+
     def __init__(self, username, email, role) -> None:
         self.id = None  
         self.username = username
@@ -14,14 +21,14 @@ class User:
             raise ValueError(f"Некорректный email: {email}")
         
         
-        valid_roles = ['admin', 'manager', 'developer']
-        if role not in valid_roles:
-            raise ValueError(f"Некорректная роль: {role}. Допустимые роли: {valid_roles}")
+        if role not in VALID_ROLES:
+            raise ValueError(f"Некорректная роль: {role}. Допустимые роли: {list(VALID_ROLES)}")
+        # Одна общая строка на роль
+        self.role = sys.intern(role)
 
     def _is_valid_email(self, email) -> bool:
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return isinstance(email, str) and EMAIL_PATTERN.match(email) is not None
 
     def update_info(self, username=None, email=None, role=None) -> None:
     
@@ -34,10 +41,11 @@ class User:
             self.email = email
             
         if role is not None:
-            valid_roles = ['admin', 'manager', 'developer']
-            if role not in valid_roles:
-                raise ValueError(f"Некорректная роль: {role}. Допустимые роли: {valid_roles}")
-            self.role = role
+            if role not in VALID_ROLES:
+                raise ValueError(
+                    f"Некорректная роль: {role}. Допустимые роли: {list(VALID_ROLES)}"
+                )
+            self.role = sys.intern(role)
 
     def to_dict(self) -> dict:
         
@@ -1,6 +1,8 @@
+import asyncio
 import sys
 import os
 import tempfile
+import time
 from datetime import datetime, timedelta
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -9,7 +11,12 @@ from database.database_manager import DatabaseManager
 from controllers.task_controller import TaskController
 from controllers.project_controller import ProjectController
 from controllers.user_controller import UserController
+from controllers.async_controllers import (
+    AsyncTaskController, AsyncProjectController, AsyncUserController
+)
+from database.async_database_manager import AsyncDatabaseManager
 from models.user import User as UserModel
+from models.task import Task
 
 def run_controller_tests():
     """Запуск тестов контроллеров"""
@@ -199,6 +206,217 @@ def run_controller_tests():
             print(f"✗ test_user_role_validation - ОШИБКА: {e}")
             tests_failed += 1
         
+        print("\n ТЕСТЫ ПАКЕТНЫХ ОПЕРАЦИЙ ")
+        
+        try:
+            # Test 14: Пакетное добавление задач с валидацией всей пачки
+            due_date = datetime.now() + timedelta(days=3)
+            ids = task_controller.add_tasks([
+                {"title": f"Batch {i}", "description": "", "priority": 2,
+                 "due_date": due_date, "project_id": 1, "assignee_id": 1}
+                for i in range(3)
+            ])
+            assert len(ids) == 3
+            assert task_controller.get_task(ids[2]).title == "Batch 2"
+            
+            count_before = len(task_controller.get_all_tasks())
+            try:
+                task_controller.add_tasks([
+                    {"title": "Ok", "description": "", "priority": 1,
+                     "due_date": due_date, "project_id": 1, "assignee_id": 1},
+                    {"title": "Bad", "description": "", "priority": 7,
+                     "due_date": due_date, "project_id": 1, "assignee_id": 1}
+                ])
+                assert False, "Невалидный приоритет прошел"
+            except ValueError:
+                pass
+            assert len(task_controller.get_all_tasks()) == count_before
+            print("✓ test_add_tasks_bulk - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_add_tasks_bulk - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 15: Просроченные задачи считаются в SQL, завершенные исключены
+            past = datetime.now() - timedelta(days=2)
+            overdue_id = db_manager.add_task(Task("Overdue", "", 1, past, 1, 1))
+            done_id = db_manager.add_task(Task("Done late", "", 1, past, 1, 1))
+            task_controller.update_task_status(done_id, "completed")
+            
+            overdue_ids = [task.id for task in task_controller.get_overdue_tasks()]
+            assert overdue_ids == [overdue_id]
+            all_overdue = task_controller.get_overdue_tasks(include_completed=True)
+            assert {task.id for task in all_overdue} == {overdue_id, done_id}
+            
+            summary = task_controller.get_overdue_summary()
+            assert summary == {'total': 1, 'by_project': {1: 1}, 'by_assignee': {1: 1}}
+            print("✓ test_overdue_tasks - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_overdue_tasks - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 16: Прогресс проектов считается агрегирующим запросом
+            project_tasks = task_controller.get_tasks_by_project(1)
+            completed = sum(1 for task in project_tasks if task.status == 'completed')
+            expected = round(completed / len(project_tasks) * 100.0, 2)
+            assert project_controller.get_project_progress(1) == expected
+            
+            empty_id = project_controller.add_project(
+                "Empty", "", datetime.now() + timedelta(days=1), datetime.now() + timedelta(days=2)
+            )
+            progress = project_controller.get_all_project_progress()
+            assert progress[1] == (len(project_tasks), completed, expected)
+            assert progress[empty_id] == (0, 0, 0.0)
+            try:
+                project_controller.get_project_progress(999)
+                assert False, "Прогресс несуществующего проекта"
+            except ValueError:
+                pass
+            print("✓ test_project_progress - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_project_progress - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 17: Количество задач по пользователям и проектам через GROUP BY
+            user_tasks = task_controller.get_tasks_by_user(1)
+            assert task_controller.count_tasks_by_user() == {1: len(user_tasks)}
+            assert task_controller.count_tasks_for_user(1) == len(user_tasks)
+            assert task_controller.count_tasks_for_user(1, status="completed") == sum(
+                1 for task in user_tasks if task.status == "completed"
+            )
+            by_status = task_controller.count_tasks_by_project(by_status=True)
+            assert sum(by_status[1].values()) == len(task_controller.get_tasks_by_project(1))
+            assert task_controller.count_tasks_for_project(999) == 0
+            print("✓ test_task_counts - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_task_counts - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 18: Импорт пользователей с отчетом по каждой строке
+            existing = user_controller.get_all_users()[0]
+            report = user_controller.import_users([
+                {'username': 'import1', 'email': 'import1@example.com', 'role': 'developer'},
+                {'username': 'import2', 'email': 'not-an-email', 'role': 'developer'},
+                {'username': existing.username, 'email': 'other@example.com', 'role': 'admin'},
+                {'username': 'import3', 'email': 'import3@example.com', 'role': 'intern'},
+                {'username': 'import4', 'email': 'import1@example.com', 'role': 'manager'},
+                {'email': 'import5@example.com', 'role': 'manager'},
+                {'username': 'import6', 'email': 'import6@example.com', 'role': 'manager'},
+            ], chunk_size=3)
+            assert [row.index for row in report] == list(range(7))
+            assert [row.status for row in report] == [
+                'inserted', 'invalid', 'duplicate', 'invalid', 'duplicate', 'invalid', 'inserted'
+            ]
+            assert user_controller.get_user(report[0].user_id).username == 'import1'
+            assert user_controller.get_user(report[6].user_id).role == 'manager'
+            assert report[1].user_id is None and report[1].reason
+            print("✓ test_import_users - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_import_users - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 19: Смена статуса набора задач одним вызовом
+            ids = [task.id for task in task_controller.get_all_tasks()]
+            assert task_controller.update_task_status_many(ids, 'in_progress') == len(ids)
+            in_progress = task_controller.count_tasks_for_project(1, status='in_progress')
+            assert in_progress == task_controller.count_tasks_for_project(1)
+            try:
+                task_controller.update_task_status_many(ids, 'archived')
+                assert False, "Некорректный статус должен отклоняться"
+            except ValueError:
+                pass
+            print("✓ test_update_task_status_many - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_update_task_status_many - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 20: Асинхронные контроллеры возвращают то же, что синхронные
+            async_dir = tempfile.mkdtemp()
+            
+            async def scenario():
+                async with AsyncDatabaseManager(
+                    os.path.join(async_dir, "async.db"), read_workers=3
+                ) as async_db:
+                    users = AsyncUserController(async_db)
+                    projects = AsyncProjectController(async_db)
+                    tasks = AsyncTaskController(async_db)
+                    
+                    user_id = await users.add_user("async", "async@example.com", "developer")
+                    start = datetime.now() + timedelta(hours=1)
+                    project_id = await projects.add_project(
+                        "Async", "", start, start + timedelta(days=30)
+                    )
+                    due = datetime.now() + timedelta(days=1)
+                    await asyncio.gather(*[
+                        tasks.add_task(f"Async {i}", "", 3, due, project_id, user_id)
+                        for i in range(20)
+                    ])
+                    
+                    sync_tasks = TaskController(async_db.db_manager)
+                    listing, counts, progress = await asyncio.gather(
+                        tasks.get_task_listing(),
+                        tasks.count_tasks_by_project(),
+                        projects.get_project_progress(project_id),
+                    )
+                    assert listing == sync_tasks.get_task_listing()
+                    assert counts == {project_id: 20}
+                    assert progress == ProjectController(
+                        async_db.db_manager
+                    ).get_project_progress(project_id)
+                    
+                    ids = [task.id async for task in async_db.iter_tasks(batch_size=7)]
+                    assert sorted(ids) == sorted(row.id for row in listing[0])
+                    
+                    # Итераторов больше, чем потоков чтения: между пачками
+                    # ни поток, ни соединение пула не удерживаются
+                    async def collect():
+                        return [task.id async for task in async_db.iter_tasks(
+                            project_id, batch_size=3
+                        )]
+                    
+                    collected = await asyncio.wait_for(
+                        asyncio.gather(*[collect() for _ in range(8)]), timeout=10
+                    )
+                    assert all(result == ids for result in collected)
+                    assert await tasks.update_task_status_many(ids, 'completed') == 20
+                    
+                    try:
+                        await tasks.update_task_status(ids[0], 'archived')
+                        assert False, "Валидация должна работать как в синхронном API"
+                    except ValueError:
+                        pass
+            
+            asyncio.run(scenario())
+            
+            # close() ждет незавершенную запись, не останавливая event loop
+            async def closing():
+                async_db = AsyncDatabaseManager(os.path.join(async_dir, "close.db"))
+                slow = asyncio.ensure_future(async_db.run_write(time.sleep, 0.5))
+                await asyncio.sleep(0.05)
+                close = asyncio.ensure_future(async_db.close())
+                started = time.monotonic()
+                await asyncio.sleep(0.05)
+                assert time.monotonic() - started < 0.3 and not close.done()
+                await asyncio.gather(slow, close)
+            
+            asyncio.run(closing())
+            print("✓ test_async_controllers - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_async_controllers - ОШИБКА: {e}")
+            tests_failed += 1
+        
     finally:
         # Очистка
         db_manager.close()
@@ -1,14 +1,19 @@
 import sys
 import os
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from database.database_manager import DatabaseManager
+from database.database_manager import DatabaseManager, INDEXES
 from models.task import Task
 from models.project import Project
 from models.user import User
+from models import task_frame
+from models.task_frame import TaskFrame
 
 def run_database_tests():
     """Запуск тестов базы данных"""
@@ -255,6 +260,646 @@ def run_database_tests():
             print(f"✗ test_foreign_keys - ОШИБКА: {e}")
             tests_failed += 1
         
+        print("\n ТЕСТЫ ИНДЕКСОВ ")
+        
+        try:
+            # Test 18: Вторичные индексы создаются и используются планировщиком
+            names = {row[0] for row in db_manager.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            assert "idx_tasks_project_created" in names
+            assert "idx_tasks_assignee_created" in names
+            assert "idx_tasks_status_due" in names
+            assert "idx_tasks_created" in names
+            plan = db_manager.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tasks "
+                "WHERE project_id = ? ORDER BY created_at DESC",
+                (1,)
+            ).fetchall()
+            assert "idx_tasks_project_created" in plan[0][3]
+            print("✓ test_indexes - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_indexes - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ПРОФИЛЕЙ PRAGMA ")
+        
+        try:
+            # Test 19: Профиль применяется и фактические настройки читаются обратно
+            profile_dir = tempfile.mkdtemp()
+            profiled = DatabaseManager(
+                os.path.join(profile_dir, "profile.db"),
+                profile="throughput",
+                pragmas={"cache_size": -2000}
+            )
+            try:
+                effective = profiled.get_pragmas()
+                assert effective["journal_mode"] == "wal"
+                assert effective["synchronous"] == "NORMAL"
+                assert effective["cache_size"] == -2000
+                assert effective["temp_store"] == "MEMORY"
+            finally:
+                profiled.close()
+            try:
+                DatabaseManager(":memory:", profile="unknown")
+                assert False, "Неизвестный профиль принят"
+            except ValueError:
+                pass
+            print("✓ test_pragma_profile - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_pragma_profile - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ПАКЕТНОЙ ВСТАВКИ ")
+        
+        try:
+            # Test 20: Пакетная вставка возвращает id в порядке входных данных
+            bulk_tasks = [
+                Task(f"Bulk {i}", "Desc", 3, datetime.now() + timedelta(days=1), 1, 1)
+                for i in range(7)
+            ]
+            ids = db_manager.add_tasks_bulk(iter(bulk_tasks), chunk_size=3)
+            assert len(ids) == 7
+            assert ids == sorted(ids)
+            assert [task.id for task in bulk_tasks] == ids
+            for i, task_id in enumerate(ids):
+                assert db_manager.get_task_by_id(task_id).title == f"Bulk {i}"
+            
+            user_ids = db_manager.add_users_bulk([
+                User("bulk1", "bulk1@example.com", "developer"),
+                User("bulk2", "bulk2@example.com", "manager")
+            ])
+            assert db_manager.get_user_by_id(user_ids[1]).username == "bulk2"
+            assert db_manager.add_projects_bulk([]) == []
+            print("✓ test_add_bulk - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_add_bulk - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ТРАНЗАКЦИЙ ")
+        
+        try:
+            # Test 21: Откат транзакции и вложенные точки сохранения
+            tx_task = Task("Tx Task", "Desc", 2, datetime.now() + timedelta(days=1), 1, 1)
+            tx_task_id = db_manager.add_task(tx_task)
+            try:
+                with db_manager.transaction():
+                    db_manager.update_task(tx_task_id, title="Changed")
+                    raise RuntimeError("откат")
+            except RuntimeError:
+                pass
+            assert db_manager.get_task_by_id(tx_task_id).title == "Tx Task"
+            
+            with db_manager.transaction():
+                db_manager.update_task(tx_task_id, priority=1)
+                try:
+                    with db_manager.transaction():
+                        db_manager.update_task(tx_task_id, title="Inner")
+                        raise RuntimeError("откат вложенной")
+                except RuntimeError:
+                    pass
+                assert db_manager.connection.in_transaction
+            updated = db_manager.get_task_by_id(tx_task_id)
+            assert updated.priority == 1
+            assert updated.title == "Tx Task"
+            assert not db_manager.connection.in_transaction
+            print("✓ test_transaction - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_transaction - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ПУЛА СОЕДИНЕНИЙ ")
+        
+        try:
+            # Test 22: Параллельное чтение из потоков и сериализованная запись
+            pool_dir = tempfile.mkdtemp()
+            pooled = DatabaseManager(os.path.join(pool_dir, "pool.db"), pool_size=3)
+            try:
+                assert pooled.get_pragmas()["journal_mode"] == "wal"
+                errors = []
+                
+                def worker(n):
+                    try:
+                        for i in range(10):
+                            pooled.add_task(Task(f"T{n}-{i}", "", 2, datetime.now(), None, None))
+                            assert pooled.get_all_tasks()
+                            pooled.search_tasks(f"T{n}")
+                    except Exception as exc:
+                        errors.append(exc)
+                
+                threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert not errors, errors
+                assert len(pooled.get_all_tasks()) == 40
+            finally:
+                pooled.close()
+            print("✓ test_connection_pool - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_connection_pool - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ПОЛНОТЕКСТОВОГО ПОИСКА ")
+        
+        try:
+            # Test 23: Префиксный поиск, синхронизация индекса и лимит
+            assert db_manager.fts_enabled
+            fts_id = db_manager.add_task(
+                Task("Deploy pipeline", "Configure kubernetes cluster", 1,
+                     datetime.now() + timedelta(days=1), 1, 1)
+            )
+            found = db_manager.search_tasks("kuber")
+            assert [task.id for task in found] == [fts_id]
+            assert db_manager.search_tasks('deploy "pipe')[0].id == fts_id
+            
+            db_manager.update_task(fts_id, description="Configure docker")
+            assert db_manager.search_tasks("kuber") == []
+            assert db_manager.search_tasks("dock")[0].id == fts_id
+            
+            assert len(db_manager.search_tasks("bulk", limit=2)) == 2
+            db_manager.delete_task(fts_id)
+            assert db_manager.search_tasks("dock") == []
+            assert db_manager.search_tasks("!!!") == []
+            print("✓ test_fts_search - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_fts_search - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ ПАГИНАЦИИ ")
+        
+        try:
+            # Test 24: Постраничный обход совпадает с полной выборкой
+            expected = [task.id for task in db_manager.get_all_tasks()]
+            expected_order = [task.id for task in sorted(
+                db_manager.get_all_tasks(), key=lambda t: (t.created_at, t.id), reverse=True
+            )]
+            paged = []
+            cursor = None
+            while True:
+                page, cursor = db_manager.get_tasks_page(limit=4, cursor=cursor)
+                assert len(page) <= 4
+                paged.extend(task.id for task in page)
+                if cursor is None:
+                    break
+            assert sorted(paged) == sorted(expected)
+            assert paged == expected_order
+            
+            page, cursor = db_manager.get_tasks_page(limit=100, project_id=1)
+            assert cursor is None
+            assert all(task.project_id == 1 for task in page)
+            
+            users, cursor = db_manager.get_users_page(limit=1)
+            assert len(users) == 1 and cursor is not None
+            try:
+                db_manager.get_users_page(cursor="not-a-cursor")
+                assert False, "Некорректный курсор принят"
+            except ValueError:
+                pass
+            print("✓ test_keyset_pagination - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_keyset_pagination - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 25: Потоковые итераторы и освобождение соединения при досрочном выходе
+            streamed = [task.id for task in db_manager.iter_tasks(batch_size=3)]
+            assert streamed == [task.id for task in db_manager.get_all_tasks()]
+            assert all(t.assignee_id == 1 for t in db_manager.iter_tasks(assignee_id=1))
+            assert len(list(db_manager.iter_users(batch_size=1))) == len(db_manager.get_all_users())
+            
+            stream_dir = tempfile.mkdtemp()
+            single = DatabaseManager(os.path.join(stream_dir, "stream.db"), pool_size=1)
+            try:
+                single.add_users_bulk([
+                    User(f"stream{i}", f"stream{i}@example.com", "developer") for i in range(5)
+                ])
+                for user in single.iter_users(batch_size=2):
+                    break
+                # Единственное соединение пула вернулось после выхода из цикла
+                assert len(single.get_all_users()) == 5
+                
+                # Чтение внутри незавершенного итератора того же потока не ждет пул
+                nested = []
+                
+                def read_while_iterating():
+                    for user in single.iter_users(batch_size=2):
+                        nested.append(single.get_user_by_id(user.id).username)
+                
+                reader = threading.Thread(target=read_while_iterating, daemon=True)
+                reader.start()
+                reader.join(5)
+                assert not reader.is_alive(), "Вложенное чтение зависло на пуле"
+                assert len(nested) == 5
+                assert len(single.get_all_users()) == 5
+            finally:
+                single.close()
+            print("✓ test_iterators - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_iterators - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 26: Список задач с именами проекта и исполнителя одним запросом
+            orphan_id = db_manager.add_task(
+                Task("Orphan", "", 3, datetime.now() + timedelta(days=1), None, None)
+            )
+            rows, cursor = db_manager.get_task_listing()
+            assert cursor is None
+            assert [row.id for row in rows] == [task.id for task in db_manager.get_all_tasks()]
+            
+            project = db_manager.get_project_by_id(1)
+            user = db_manager.get_user_by_id(1)
+            owned = [row for row in rows if row.project_id == 1 and row.assignee_id == 1]
+            assert owned and all(row.project_name == project.name for row in owned)
+            assert all(row.assignee_name == user.username for row in owned)
+            orphan = next(row for row in rows if row.id == orphan_id)
+            assert orphan.project_name is None and orphan.assignee_name is None
+            
+            filtered, _ = db_manager.get_task_listing(filters={"ids": [orphan_id]})
+            assert [row.id for row in filtered] == [orphan_id]
+            first, cursor = db_manager.get_task_listing({"assignee_id": 1}, limit=2)
+            second, _ = db_manager.get_task_listing({"assignee_id": 1}, limit=2, cursor=cursor)
+            assert len(first) == 2 and first[-1].id != second[0].id
+            print("✓ test_task_listing - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_task_listing - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ КЭША ")
+        
+        try:
+            # Test 27: Identity map: попадания, вытеснение, TTL и инвалидация при записи
+            cache_dir = tempfile.mkdtemp()
+            cached = DatabaseManager(os.path.join(cache_dir, "cache.db"), cache_size=2)
+            try:
+                ids = cached.add_users_bulk([
+                    User(f"cached{i}", f"cached{i}@example.com", "developer") for i in range(3)
+                ])
+                first = cached.get_user_by_id(ids[0])
+                assert cached.get_user_by_id(ids[0]) is first
+                stats = cached.get_cache_stats()["users"]
+                assert stats["hits"] == 1 and stats["misses"] == 1
+                
+                cached.get_user_by_id(ids[1])
+                cached.get_user_by_id(ids[2])
+                assert cached.get_cache_stats()["users"]["evictions"] == 1
+                
+                cached.update_user(ids[2], role="admin")
+                assert cached.get_user_by_id(ids[2]).role == "admin"
+                cached.delete_user(ids[1])
+                assert cached.get_user_by_id(ids[1]) is None
+                
+                cached.user_cache.ttl = 0.01
+                cached.get_user_by_id(ids[0])
+                time.sleep(0.02)
+                misses = cached.get_cache_stats()["users"]["misses"]
+                cached.get_user_by_id(ids[0])
+                assert cached.get_cache_stats()["users"]["misses"] == misses + 1
+            finally:
+                cached.close()
+            print("✓ test_identity_cache - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_identity_cache - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        print("\n ТЕСТЫ TASKFRAME ")
+        
+        try:
+            # Test 28: TaskFrame: фильтр, группировка, сортировка и обратно в Task
+            tasks = db_manager.get_all_tasks()
+            frame = db_manager.get_task_frame()
+            assert len(frame) == len(tasks)
+            assert sorted(frame.column("id").tolist()) == sorted(task.id for task in tasks)
+            
+            now = datetime.now()
+            overdue = frame.overdue(now=now)
+            expected = {task.id for task in tasks
+                        if task.status != "completed" and task.due_date < now}
+            assert set(overdue.column("id").tolist()) == expected
+            
+            urgent = frame.filter(priority=[4, 5], status="pending")
+            assert all(p in (4, 5) for p in urgent.column("priority").tolist())
+            by_status = frame.group_count("status")
+            assert sum(by_status.values()) == len(tasks)
+            assert by_status.get("pending", 0) == sum(t.status == "pending" for t in tasks)
+            
+            ordered = frame.sort("due_date", descending=True)
+            dues = ordered.column("due_date").tolist()
+            assert dues == sorted(dues, reverse=True)
+            restored = ordered.to_tasks(db_manager)
+            assert [task.id for task in restored] == ordered.column("id").tolist()
+            assert db_manager.get_task_frame(project_id=1).group_count("project_id").keys() <= {1}
+            
+            # Неизвестный статус не смешивается с последним кодом STATUS_CODES
+            unknown = TaskFrame.from_rows([(1, 1, -1, 1, 1, 0.0, 0.0), (2, 1, 2, 1, 1, 0.0, 0.0)])
+            assert unknown.group_count("status") == {None: 1, "completed": 1}
+            
+            # Оба бэкенда - array и NumPy (если установлен) - дают одинаковый результат
+            numpy_module = task_frame.np
+            rows = [(i, priority, i % 3, 1, 1, float(i), 0.0)
+                    for i, priority in enumerate([3, 5, 3, 1, 5, 3], start=1)]
+            try:
+                for backend in [None] + ([numpy_module] if numpy_module is not None else []):
+                    task_frame.np = backend
+                    frame = TaskFrame.from_rows(rows)
+                    ids = frame.sort("priority", descending=True).column("id").tolist()
+                    assert ids == [2, 5, 1, 3, 6, 4]
+                    assert frame.sort("priority").column("id").tolist() == [4, 1, 3, 6, 2, 5]
+                    narrowed = frame.filter(priority=3, status="in_progress")
+                    assert narrowed.column("id").tolist() == [1]
+                    assert frame.group_count("status") == {
+                        "pending": 2, "in_progress": 2, "completed": 2
+                    }
+                    try:
+                        frame.filter(status="done")
+                        assert False, "Неизвестный статус принят"
+                    except ValueError as error:
+                        assert "done" in str(error)
+            finally:
+                task_frame.np = numpy_module
+            print("✓ test_task_frame - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_task_frame - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 29: Режим epoch: миграция существующего файла и целочисленные даты
+            epoch_dir = tempfile.mkdtemp()
+            epoch_path = os.path.join(epoch_dir, "epoch.db")
+            legacy = DatabaseManager(epoch_path)
+            user_id = legacy.add_user(User("epoch", "epoch@example.com", "developer"))
+            project_id = legacy.add_project(Project(
+                "Epoch", "", datetime(2024, 1, 1, 9, 30, 0, 123456), datetime(2024, 12, 31)
+            ))
+            legacy.add_tasks_bulk([
+                Task(f"Epoch task {i}", "", 3, datetime.now() + timedelta(days=2 * i - 3),
+                     project_id, user_id)
+                for i in range(5)
+            ])
+            before = [(t.id, t.due_date, t.created_at) for t in legacy.get_all_tasks()]
+            legacy.close()
+            
+            migrated = DatabaseManager(epoch_path, timestamps="epoch")
+            try:
+                assert [(t.id, t.due_date, t.created_at)
+                        for t in migrated.get_all_tasks()] == before
+                kinds = migrated.connection.execute(
+                    "SELECT DISTINCT typeof(due_date), typeof(created_at) FROM tasks"
+                ).fetchall()
+                assert kinds == [("integer", "integer")]
+                project = migrated.get_project_by_id(project_id)
+                assert project.start_date == datetime(2024, 1, 1, 9, 30, 0, 123456)
+                
+                overdue = {task.id for task in migrated.get_overdue_tasks()}
+                assert overdue == set(migrated.get_task_frame().overdue().column("id").tolist())
+                assert len(overdue) == 2
+                assert len(migrated.search_tasks("Epoch")) == 5
+                new_id = migrated.add_task(
+                    Task("Fresh", "", 1, datetime(2030, 1, 1), project_id, user_id)
+                )
+                assert new_id == 6 and migrated.get_task_by_id(new_id).due_date.year == 2030
+            finally:
+                migrated.close()
+            
+            reopened = DatabaseManager(epoch_path)
+            assert reopened.timestamps == "epoch"
+            reopened.close()
+            
+            # Прямой вызов миграции восстанавливает индексы и триггеры FTS
+            direct = DatabaseManager(os.path.join(epoch_dir, "direct.db"))
+            try:
+                direct.add_user(User("alpha", "alpha@example.com", "developer"))
+                direct.migrate_to_epoch()
+                schema = {row[0] for row in direct.connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')"
+                )}
+                assert {name for name, _, _ in INDEXES} <= schema
+                assert {"tasks_fts_ai", "tasks_fts_ad", "tasks_fts_au"} <= schema
+                direct_project = direct.add_project(Project(
+                    "Direct", "", datetime(2024, 1, 1), datetime(2024, 12, 31)
+                ))
+                direct.add_task(Task("bravo", "", 1, datetime(2030, 1, 1), direct_project, 1))
+                assert [task.title for task in direct.search_tasks("bravo")] == ["bravo"]
+            finally:
+                direct.close()
+            print("✓ test_epoch_timestamps - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_epoch_timestamps - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 30: Массовое обновление одним запросом с точным числом строк
+            tasks = db_manager.get_tasks_by_project(1)
+            ids = [task.id for task in tasks]
+            assert db_manager.update_tasks_where(ids + [999999], priority=2) == len(ids)
+            assert all(db_manager.get_task_by_id(i).priority == 2 for i in ids)
+            assert db_manager.update_tasks_where({"project_id": 1}, priority=4) == len(ids)
+            assert db_manager.update_tasks_where(
+                {"project_id": 1, "status": ["pending", "in_progress"]}, priority=4
+            ) == sum(task.status != "completed" for task in tasks)
+            assert db_manager.update_tasks_where([], priority=1) == 0
+            
+            # Раньше total_changes делал результат истинным после любой записи
+            assert db_manager.update_task(999999, priority=1) is False
+            assert db_manager.delete_task(999999) is False
+            
+            user = db_manager.get_user_by_id(1)
+            assert db_manager.update_users_where({"role": user.role}, role=user.role) >= 1
+            assert db_manager.get_user_by_id(1) is not user
+            try:
+                db_manager.update_tasks_where({"title": "x"}, priority=1)
+                assert False, "Фильтр по title должен отклоняться"
+            except ValueError:
+                pass
+            print("✓ test_update_where - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_update_where - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 31: Компилятор UPDATE: проверка колонок, порядок и кэш запросов
+            compiler = db_manager.statements
+            assert compiler.update_columns("tasks", {"status": 1, "priority": 2}) == (
+                "priority", "status"
+            )
+            first = compiler.update("tasks", ("priority", "status"), "id IN (?)")
+            assert compiler.update("tasks", ("priority", "status"), "id IN (?)") is first
+            
+            for bad_fields in ({"id": 5}, {"no_such_column": 1}, {"status = 'x' --": 1}):
+                try:
+                    db_manager.update_task(1, **bad_fields)
+                    assert False, f"Колонки {list(bad_fields)} должны отклоняться"
+                except ValueError:
+                    pass
+            
+            task_id = db_manager.get_all_tasks()[0].id
+            db_manager.update_task(task_id, status="pending", priority=3)
+            db_manager.update_task(task_id, priority=5, status="completed")
+            task = db_manager.get_task_by_id(task_id)
+            assert task.priority == 5 and task.status == "completed"
+            print("✓ test_statement_compiler - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_statement_compiler - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 32: Окно списка по смещению совпадает со срезом полного списка
+            full, _ = db_manager.get_task_listing()
+            assert db_manager.count_task_listing() == len(full)
+            for offset in (0, 1, len(full) // 2, len(full) - 1):
+                window = db_manager.get_task_listing_window(offset, 3)
+                assert [row.id for row in window] == [row.id for row in full[offset:offset + 3]]
+            assert db_manager.get_task_listing_window(len(full) + 10, 3) == []
+            
+            owned, _ = db_manager.get_task_listing({"project_id": 1})
+            assert db_manager.count_task_listing({"project_id": 1}) == len(owned)
+            window = db_manager.get_task_listing_window(1, 2, {"project_id": 1})
+            assert [row.id for row in window] == [row.id for row in owned[1:3]]
+            print("✓ test_task_listing_window - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_task_listing_window - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 33: Поиск в списке, уточнение среди найденных строк и отмена запроса
+            due = datetime.now() + timedelta(days=3)
+            db_manager.add_tasks_bulk([
+                Task("Квартальный отчет", "сводка продаж", 2, due, 1, 1),
+                Task("Отчетность налоговая", "", 2, due, 1, 1),
+                Task("Релиз", "подготовить отчет для клиента", 2, due, 1, 1),
+            ])
+            found, _ = db_manager.get_task_listing({"query": "отч"})
+            assert len(found) == 3
+            narrowed, _ = db_manager.get_task_listing({"query": "отчет кв"})
+            assert [row.title for row in narrowed] == ["Квартальный отчет"]
+            found_ids = [row.id for row in found]
+            for query in ("отчет", "отчетн", "отчет кв", "отч подг"):
+                expected, _ = db_manager.get_task_listing({"query": query})
+                within, _ = db_manager.get_task_listing({"query": query, "ids": found_ids})
+                assert [row.id for row in within] == [row.id for row in expected], query
+            assert db_manager.count_task_listing({"query": "отч", "project_id": 1}) == 3
+            
+            # Слова запроса разбиваются как в unicode61: "_" - разделитель
+            db_manager.add_tasks_bulk([
+                Task("foo_bar report", "", 2, due, 1, 1),
+                Task("Café menu", "", 2, due, 1, 1),
+                Task("Ωμέγα bar", "Ёлка", 2, due, 1, 1),
+                Task("Йогурт", "", 2, due, 1, 1),
+            ])
+            for broad, narrow in (("ba", "bar"), ("caf", "cafe"), ("caf", "café"),
+                                  ("ё", "ёл"), ("й", "йо"), ("ωμ", "ωμε"), ("bar", "bar_r")):
+                found, _ = db_manager.get_task_listing({"query": broad})
+                expected, _ = db_manager.get_task_listing({"query": narrow})
+                within, _ = db_manager.get_task_listing(
+                    {"query": narrow, "ids": [row.id for row in found]}
+                )
+                assert [row.id for row in within] == [row.id for row in expected], narrow
+            
+            # Без FTS уточнение идет тем же LIKE
+            db_manager.fts_enabled = False
+            try:
+                everything = [row.id for row in db_manager.get_task_listing()[0]]
+                for query in ("REPORT", "Отчет", "отчет", "o_bar", "menu"):
+                    expected, _ = db_manager.get_task_listing({"query": query})
+                    within, _ = db_manager.get_task_listing({"query": query, "ids": everything})
+                    assert [row.id for row in within] == [row.id for row in expected], query
+            finally:
+                db_manager.fts_enabled = True
+            
+            try:
+                with db_manager.cancellable(lambda: True, interval=1):
+                    db_manager.get_task_listing({"query": "отч"})
+                assert False, "Отмененный запрос должен прерываться"
+            except Exception as e:
+                assert "interrupted" in str(e), e
+            assert len(db_manager.get_task_listing({"query": "отч"})[0]) == 3
+            print("✓ test_listing_search - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_listing_search - ОШИБКА: {e}")
+            tests_failed += 1
+        
+        try:
+            # Test 34: Чтение, обогнанное записью, не кладет в кэш устаревший объект
+            race_dir = tempfile.mkdtemp()
+            pooled = DatabaseManager(os.path.join(race_dir, "race.db"), pool_size=2)
+            try:
+                project_id = pooled.add_project(Project(
+                    "old", "", datetime.now() + timedelta(hours=1),
+                    datetime.now() + timedelta(days=30)
+                ))
+                pooled.clear_caches()
+                selected = threading.Event()
+                written = threading.Event()
+                original_read = pooled._read
+                
+                # Читатель получил старую строку и ждет, пока запись закоммитится
+                @contextmanager
+                def delayed_read():
+                    with original_read() as connection:
+                        yield connection
+                    if threading.current_thread() is not threading.main_thread():
+                        selected.set()
+                        written.wait(5)
+                
+                pooled._read = delayed_read
+                reader = threading.Thread(target=pooled.get_project_by_id, args=(project_id,))
+                reader.start()
+                assert selected.wait(5)
+                pooled.update_project(project_id, name="new")
+                written.set()
+                reader.join(5)
+                pooled._read = original_read
+                assert pooled.get_project_by_id(project_id).name == "new"
+                
+                # То же для инвалидации внутри transaction(): она идет до коммита
+                selected.clear()
+                written.clear()
+                pooled._read = delayed_read
+                reader = threading.Thread(target=pooled.get_project_by_id, args=(project_id,))
+                with pooled.transaction():
+                    pooled.update_project(project_id, name="newer")
+                    reader.start()
+                    assert selected.wait(5)
+                written.set()
+                reader.join(5)
+                pooled._read = original_read
+                assert pooled.get_project_by_id(project_id).name == "newer"
+                
+                # Читатель целиком укладывается между инвалидацией и коммитом
+                # и кладет в кэш старую строку уже с новым поколением
+                with pooled.transaction():
+                    pooled.update_project(project_id, name="newest")
+                    reader = threading.Thread(target=pooled.get_project_by_id, args=(project_id,))
+                    reader.start()
+                    reader.join(5)
+                    assert pooled.project_cache.get(project_id).name == "newer"
+                assert pooled.get_project_by_id(project_id).name == "newest"
+            finally:
+                pooled.close()
+            print("✓ test_cache_fill_race - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_cache_fill_race - ОШИБКА: {e}")
+            tests_failed += 1
+        
     finally:
         # Очистка
         db_manager.close()
@@ -153,6 +153,29 @@ def run_tests():
         print(f"✗ test_user_email_validation - ОШИБКА: {e}")
         tests_failed += 1
     
+    try:
+        # Test 12: Модели на __slots__ и общие строки статусов
+        task = Task("Slots", "Desc", 1, datetime.now() + timedelta(days=1), 1, 1)
+        assert not hasattr(task, "__dict__")
+        task.update_status("".join(["in_", "progress"]))
+        assert task.status is sys.intern("in_progress")
+        assert set(task.to_dict()) == {
+            'id', 'title', 'description', 'priority', 'status', 'due_date',
+            'project_id', 'assignee_id', 'created_at', 'is_overdue'
+        }
+        user = User("slots", "slots@example.com", "".join(["adm", "in"]))
+        assert user.role is sys.intern("admin")
+        try:
+            user.nickname = "x"
+            assert False, "Лишний атрибут принят"
+        except AttributeError:
+            pass
+        print("✓ test_models_slots - ПРОЙДЕН")
+        tests_passed += 1
+    except Exception as e:
+        print(f"✗ test_models_slots - ОШИБКА: {e}")
+        tests_failed += 1
+    
     # Итоги
     print(f"ИТОГ: {tests_passed} пройдено, {tests_failed} не пройдено")
     
@@ -0,0 +1,466 @@
+import sys
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from database.database_manager import DatabaseManager
+from models.task import Task
+from views.background import BackgroundLoader
+from views.tree_sync import KeyedTree
+from views.virtual_tree import VirtualTreeview
+from views.task_view import TaskView
+from controllers.task_controller import TaskController
+
+
+class FakeWidget:
+    # Вместо цикла Tk: after() копит вызовы, run_pending() выполняет накопленные
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return len(self.pending)
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run_pending(self):
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+
+
+class FakeTree(FakeWidget):
+    # Минимальный ttk.Treeview: строки, порядок и геометрия для VirtualTreeview
+    def __init__(self, height=15, pixel_height=1, row_height=20, header_height=25):
+        super().__init__()
+        self.options = {'height': height}
+        self.pixel_height = pixel_height
+        self.row_height = row_height
+        self.header_height = header_height
+        self.rows = {}
+        self.order = []
+        self.bindings = {}
+        self.calls = []  # Изменяющие вызовы Tk: (метод, iid)
+
+    def insert(self, parent, index, iid, values):
+        self.calls.append(("insert", iid))
+        self.rows[iid] = values
+        self.order.insert(len(self.order) if index == "end" else index, iid)
+
+    def item(self, iid, values):
+        self.calls.append(("item", iid))
+        self.rows[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.calls.append(("delete", iid))
+            del self.rows[iid]
+            self.order.remove(iid)
+
+    def get_children(self, item=""):
+        return tuple(self.order)
+
+    def set_children(self, item, *iids):
+        self.calls.append(("set_children", None))
+        self.order = list(iids)
+
+    def cget(self, name):
+        return self.options[name]
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings[sequence] = callback
+
+    def yview_moveto(self, fraction):
+        self.first_shown = int(round(fraction * len(self.order)))
+
+    def winfo_height(self):
+        return self.pixel_height
+
+    def bbox(self, iid):
+        # Строки после first_shown идут сразу под заголовком
+        position = self.order.index(iid) - self.first_shown
+        return (0, self.header_height + position * self.row_height, 100, self.row_height)
+
+    def after_idle(self, callback):
+        self.pending.append(callback)
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ""
+
+    def config(self, text):
+        self.text = text
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class FakeScrollbar:
+    def __init__(self):
+        self.fractions = None
+
+    def configure(self, **options):
+        pass
+
+    def set(self, first, last):
+        self.fractions = (first, last)
+
+
+def wait_for(widget, predicate, timeout=5):
+    """Крутит фальшивый цикл Tk, пока predicate() не станет истинным"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Результат загрузки не пришел"
+        widget.run_pending()
+        time.sleep(0.01)
+
+
+def run_view_tests():
+    """Запуск тестов логики представлений без Tk"""
+    print(" ЗАПУСК ТЕСТОВ ПРЕДСТАВЛЕНИЙ")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "views.db")
+    db_manager = DatabaseManager(db_path)
+
+    try:
+        print("\n ТЕСТЫ ФОНОВОЙ ЗАГРУЗКИ ")
+
+        try:
+            # Test 1: Устаревшие результаты отбрасываются, устаревшие запросы не выполняются
+            widget = FakeWidget()
+            loader = BackgroundLoader(widget, db_path)
+            try:
+                started = threading.Event()
+                release = threading.Event()
+                calls = []
+                delivered = []
+
+                def slow(source):
+                    calls.append("slow")
+                    started.set()
+                    release.wait(5)
+                    return "slow"
+
+                def queued(source):
+                    calls.append("queued")
+                    return "queued"
+
+                def latest(source):
+                    calls.append("latest")
+                    return "latest"
+
+                first = loader.submit('tasks', slow, delivered.append)
+                assert started.wait(5)
+                loader.submit('tasks', queued, delivered.append)
+                last = loader.submit('tasks', latest, delivered.append)
+                assert loader.current('tasks') == last and not loader.is_current('tasks', first)
+                release.set()
+                wait_for(widget, lambda: delivered)
+                assert delivered == ["latest"]
+                assert calls == ["slow", "latest"]
+
+                # Запросы с другими ключами друг друга не отменяют
+                loader.submit('users', lambda source: "users", delivered.append)
+                loader.submit('projects', lambda source: "projects", delivered.append)
+                wait_for(widget, lambda: len(delivered) == 3)
+                assert sorted(delivered[1:]) == ["projects", "users"]
+            finally:
+                loader.close()
+            print("✓ test_loader_generations - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_loader_generations - ОШИБКА: {e}")
+            tests_failed += 1
+
+        try:
+            # Test 2: cancel() и доставка ошибок в on_error
+            widget = FakeWidget()
+            loader = BackgroundLoader(widget, db_path)
+            try:
+                results = []
+                errors = []
+                release = threading.Event()
+
+                def blocked(source):
+                    release.wait(5)
+                    return "cancelled"
+
+                loader.submit('tasks', blocked, results.append, errors.append)
+                loader.cancel('tasks')
+                release.set()
+
+                def failing(source):
+                    raise ValueError("сбой загрузки")
+
+                loader.submit('users', failing, results.append, errors.append)
+                wait_for(widget, lambda: errors)
+                assert results == []
+                assert isinstance(errors[0], ValueError) and "сбой" in str(errors[0])
+            finally:
+                loader.close()
+            print("✓ test_loader_cancel_and_errors - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_loader_cancel_and_errors - ОШИБКА: {e}")
+            tests_failed += 1
+
+        try:
+            # Test 3: Загрузчик не меняет режим журнала файла БД
+            widget = FakeWidget()
+            loader = BackgroundLoader.for_manager(widget, db_manager)
+            try:
+                results = []
+                loader.submit('tasks', lambda source: source.db_manager.get_pragmas(),
+                              results.append)
+                wait_for(widget, lambda: results)
+                assert results[0]["journal_mode"] == "delete"
+                assert results[0]["busy_timeout"] == 5000
+                assert not os.path.exists(db_path + "-wal")
+                assert loader.db_options["timestamps"] == db_manager.timestamps
+            finally:
+                loader.close()
+
+            # В режиме WAL, выбранном приложением, чтение в фоне не блокирует запись
+            wal_manager = DatabaseManager(os.path.join(temp_dir, "wal.db"),
+                                          pragmas={"journal_mode": "WAL"})
+            loader = BackgroundLoader.for_manager(widget, wal_manager)
+            try:
+                reading = threading.Event()
+                written = threading.Event()
+                results = []
+
+                def hold_read(source):
+                    # Открытая транзакция чтения на все время записи
+                    connection = source.db_manager.connection
+                    connection.execute("BEGIN")
+                    connection.execute("SELECT COUNT(*) FROM tasks").fetchone()
+                    reading.set()
+                    written.wait(5)
+                    connection.rollback()
+                    return source.db_manager.get_pragmas()
+
+                loader.submit('tasks', hold_read, results.append)
+                assert reading.wait(5)
+                started = time.monotonic()
+                wal_manager.add_task(Task("Во время чтения", "", 2,
+                                          datetime.now() + timedelta(days=1), None, None))
+                elapsed = time.monotonic() - started
+                written.set()
+                wait_for(widget, lambda: results)
+                assert elapsed < 1, f"Запись ждала чтения {elapsed:.2f} с"
+                assert results[0]["journal_mode"] == "wal"
+            finally:
+                loader.close()
+                wal_manager.close()
+            print("✓ test_loader_connection - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_loader_connection - ОШИБКА: {e}")
+            tests_failed += 1
+
+        print("\n ТЕСТЫ СПИСКОВ ")
+
+        try:
+            # Test 4: KeyedTree трогает в Tk только новые, измененные и пропавшие строки
+            tree = FakeTree()
+            rows = KeyedTree(tree)
+            rows.sync([(1, ("a",)), (2, ("b",)), (3, ("c",))])
+            assert tree.order == ["1", "2", "3"] and len(tree.calls) == 3
+
+            tree.calls.clear()
+            rows.sync([(1, ("a",)), (2, ("B",)), (3, ("c",))])
+            assert tree.calls == [("item", "2")] and tree.rows["2"] == ("B",)
+
+            tree.calls.clear()
+            rows.sync([(3, ("c",)), (1, ("a",)), (4, ("d",))])
+            assert tree.calls == [("insert", "4"), ("delete", "2"), ("set_children", None)]
+            assert tree.order == ["3", "1", "4"] and "2" not in rows.values
+
+            rows.upsert(5, ("e",), index=0)
+            rows.upsert(3, ("C",))
+            rows.remove(1)
+            rows.remove(1)  # Повторное удаление ничего не делает
+            assert tree.order == ["5", "3", "4"] and tree.rows["3"] == ("C",)
+            rows.clear()
+            assert tree.order == [] and rows.values == {}
+
+            # Пачечная синхронизация прекращается, когда пришел более новый список
+            current = [True]
+            done = []
+            rows.sync(((i, (i,)) for i in range(10)), chunk_size=3,
+                      is_current=lambda: current[0], on_done=lambda: done.append(1))
+            assert len(tree.order) == 3
+            tree.run_pending()
+            current[0] = False
+            tree.run_pending()
+            assert len(tree.order) == 6 and not done and not tree.pending
+
+            rows.sync(((i, (i,)) for i in range(10, 14)), chunk_size=3,
+                      on_done=lambda: done.append(1))
+            while tree.pending:
+                tree.run_pending()
+            assert tree.order == ["10", "11", "12", "13"] and done == [1]
+            print("✓ test_keyed_tree - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_keyed_tree - ОШИБКА: {e}")
+            tests_failed += 1
+
+        try:
+            # Test 5: Число видимых строк виртуального списка следует за высотой виджета
+            tree = FakeTree(height=15)
+            scrollbar = FakeScrollbar()
+            virtual = VirtualTreeview(
+                KeyedTree(tree), scrollbar,
+                fetch_rows=lambda offset, limit: list(range(offset, min(offset + limit, 1000))),
+                row_values=lambda row: (row,), row_key=lambda row: row, margin=10
+            )
+            virtual.reset(1000)
+            assert virtual.visible == 15  # Еще не отображен - опция height
+
+            # Окно растянули: 25 px заголовка + 40 строк по 20 px
+            tree.pixel_height = 25 + 40 * 20
+            tree.bindings['<Configure>']()
+            assert virtual.visible == 40
+            virtual.scroll_to(10 ** 6)
+            assert virtual.top == 960
+            assert scrollbar.fractions == (0.96, 1.0)
+            assert tree.order[-1] == "999"
+
+            tree.pixel_height = 25 + 10 * 20
+            tree.bindings['<Configure>']()
+            assert virtual.visible == 10 and scrollbar.fractions == (0.96, 0.97)
+            print("✓ test_virtual_visible_rows - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_virtual_visible_rows - ОШИБКА: {e}")
+            tests_failed += 1
+
+        try:
+            # Test 6: Виртуальный список с поиском: число строк и первое окно - в фоне
+            db_manager.add_tasks_bulk([
+                Task(f"Отчет {i}" if i % 2 else f"Релиз {i}", "", 2,
+                     datetime.now() + timedelta(days=1), None, None)
+                for i in range(300)
+            ])
+            widget = FakeWidget()
+            loader = BackgroundLoader.for_manager(widget, db_manager)
+            try:
+                view = TaskView.__new__(TaskView)
+                view.loader = loader
+                view.loading_label = FakeLabel()
+                view.task_controller = TaskController(db_manager)
+                view.list_filters = {'query': "отчет"}
+                foreground_fetches = []
+
+                def fetch_rows(offset, limit):
+                    foreground_fetches.append(offset)
+                    return view.task_controller.get_task_listing_window(
+                        offset, limit, filters=view.list_filters
+                    )
+
+                tree = FakeTree(height=15)
+                view.task_rows = KeyedTree(tree)
+                view.virtual_tree = VirtualTreeview(
+                    view.task_rows, FakeScrollbar(), fetch_rows,
+                    row_values=TaskView._task_values, margin=20
+                )
+                view._refresh_virtual()
+                assert view.loading_label.text == "Загрузка..."
+                wait_for(widget, lambda: view.virtual_tree.total)
+                assert view.virtual_tree.total == 150
+                assert len(tree.order) == 15 + 2 * 20 and foreground_fetches == []
+                assert all(values[1].startswith("Отчет") for values in tree.rows.values())
+                assert view.loading_label.text == ""
+
+                view.virtual_tree.scroll_to(100)
+                assert foreground_fetches == [80]
+            finally:
+                loader.close()
+            print("✓ test_virtual_search_loader - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_virtual_search_loader - ОШИБКА: {e}")
+            tests_failed += 1
+
+        try:
+            # Test 7: Уточнение поиска - запрос среди найденных строк в потоке загрузки
+            tree = FakeTree()
+            loader = BackgroundLoader.for_manager(tree, db_manager)
+            try:
+                view = TaskView.__new__(TaskView)
+                view.loader = loader
+                view.loading_label = FakeLabel()
+                view.task_controller = None  # В потоке Tk запросов к базе нет
+                view.task_rows = KeyedTree(tree)
+                view.virtual_tree = None
+                view.search_var = FakeVar()
+                view.list_filters = {}
+                view._search_cache = None
+                view._search_after_id = None
+                loads = []
+
+                def load_tasks(source, filters=None):
+                    loads.append((threading.current_thread(), filters))
+                    return TaskView._load_tasks(source, filters)
+
+                view._load_tasks = load_tasks
+                controller = TaskController(db_manager)
+
+                def search(query):
+                    view.search_var.set(query)
+                    view._run_search()
+                    wait_for(tree, lambda: view._search_cache is not None
+                             and view._search_cache[0] == query
+                             and not view.loading_label.text)
+                    expected, _ = controller.get_task_listing({'query': query})
+                    assert tree.order == [str(row.id) for row in expected], query
+                    return expected
+
+                found = search("отч")
+                search("отчет 1")
+                assert loads[1][1] == {'query': "отчет 1", 'ids': [row.id for row in found]}
+                assert all(thread.name == "ui-loader" for thread, _ in loads)
+            finally:
+                loader.close()
+            print("✓ test_search_narrowing_loader - ПРОЙДЕН")
+            tests_passed += 1
+        except Exception as e:
+            print(f"✗ test_search_narrowing_loader - ОШИБКА: {e}")
+            tests_failed += 1
+
+    finally:
+        db_manager.close()
+
+    print(f"ИТОГ: {tests_passed} пройдено, {tests_failed} не пройдено")
+
+    if tests_failed == 0:
+        print(" ВСЕ ТЕСТЫ ПРЕДСТАВЛЕНИЙ ПРОЙДЕНЫ УСПЕШНО!")
+    else:
+        print("  Есть непройденные тесты")
+
+    return tests_passed, tests_failed
+
+if __name__ == "__main__":
+    run_view_tests()
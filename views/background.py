@@ -0,0 +1,199 @@
+import queue
+import threading
+from functools import partial
+from tkinter import messagebox
+from database.database_manager import DatabaseManager
+from controllers.task_controller import TaskController
+from controllers.project_controller import ProjectController
+from controllers.user_controller import UserController
+
+# Сколько строк Treeview вставляется за одну итерацию цикла Tk
+LOAD_CHUNK_SIZE = 500
+
+# Соединение потока загрузки: busy_timeout сглаживает короткие блокировки.
+# journal_mode не навязывается - режим журнала хранится в самом файле БД и
+# выбирается при развертывании (profile / pragmas DatabaseManager). Только в
+# режиме WAL чтения в фоне не задерживают коммиты потока Tk; с журналом
+# отката запись ждет конца чтения, но не дольше busy_timeout
+LOADER_PRAGMAS = {"busy_timeout": 5000}
+
+
+class WorkerControllers:
+    # Контроллеры потока загрузки; имена атрибутов совпадают с атрибутами
+    # представлений, поэтому функции загрузки работают с обоими
+    def __init__(self, db_manager) -> None:
+        self.db_manager = db_manager
+        self.task_controller = TaskController(db_manager)
+        self.project_controller = ProjectController(db_manager)
+        self.user_controller = UserController(db_manager)
+
+
+class BackgroundLoader:
+    def __init__(self, widget, db_path, poll_ms=50, pragmas=None, **db_options) -> None:
+        # Запросы выполняются в отдельном потоке со своим соединением SQLite,
+        # результаты забираются в потоке Tk опросом очереди через after()
+        if db_path == ":memory:":
+            raise ValueError("Фоновая загрузка не поддерживается для базы :memory:")
+
+        self.widget = widget
+        self.db_path = db_path
+        self.poll_ms = poll_ms
+        # Identity map потоку загрузки не нужен: изменения делает поток Tk
+        self.db_options = {
+            "cache_size": 0, "pragmas": {**LOADER_PRAGMAS, **(pragmas or {})}, **db_options
+        }
+
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._generations = {}  # Ключ запроса -> номер последнего запроса с этим ключом
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="ui-loader", daemon=True)
+        self._thread.start()
+        self._poll()
+
+    @classmethod
+    def for_manager(cls, widget, db_manager, **options) -> 'BackgroundLoader':
+
+        # Соединение потока загрузки настраивается как соединение приложения:
+        # те же PRAGMA и тот же формат меток времени
+        return cls(
+            widget, db_manager.db_path, pragmas=db_manager.pragmas,
+            timestamps=db_manager.timestamps, **options
+        )
+
+    def submit(self, key, load, on_result, on_error=None) -> int:
+
+        # load(controllers) выполняется в потоке загрузки, on_result(result)
+        # и on_error(error) - в потоке Tk. Новый запрос с тем же ключом
+        # делает устаревшими все предыдущие: их результаты отбрасываются
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+        self._requests.put((key, generation, load, on_result, on_error))
+        return generation
+
+    def cancel(self, key) -> None:
+
+        # Делает устаревшими все запросы с этим ключом, не создавая нового
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def current(self, key) -> int:
+
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def is_current(self, key, generation) -> bool:
+
+        return self.current(key) == generation
+
+    def _run(self) -> None:
+
+        db_manager = DatabaseManager(self.db_path, **self.db_options)
+        controllers = WorkerControllers(db_manager)
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    break
+
+                self._execute(db_manager, controllers, *request)
+        finally:
+            db_manager.close()
+
+    def _execute(self, db_manager, controllers, key, generation, load, on_result,
+                 on_error) -> None:
+
+        # Запрос устарел еще в очереди - не тратим на него время
+        if not self.is_current(key, generation):
+            return
+
+        # Запрос, устаревший уже во время выполнения, прерывается
+        # прямо внутри SQLite; его ошибка будет отброшена в _poll
+        def superseded():
+            return not self.is_current(key, generation)
+
+        try:
+            with db_manager.cancellable(superseded):
+                result = load(controllers)
+            self._results.put((key, generation, result, None, on_result, on_error))
+        except Exception as e:
+            self._results.put((key, generation, None, e, on_result, on_error))
+
+    def _poll(self) -> None:
+
+        while True:
+            try:
+                self._deliver(*self._results.get_nowait())
+            except queue.Empty:
+                break
+
+        if not self._closed:
+            self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _deliver(self, key, generation, result, error, on_result, on_error) -> None:
+
+        # Результаты устаревших запросов отбрасываются
+        if not self.is_current(key, generation):
+            return
+        if error is None:
+            on_result(result)
+        elif on_error is not None:
+            on_error(error)
+
+    def close(self) -> None:
+
+        self._closed = True
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._requests.put(None)
+        self._thread.join(timeout=5)
+
+
+class BackgroundListMixin:
+    # Общая часть представлений-списков: загрузка через self.loader (или сразу
+    # в потоке Tk), индикатор self.loading_label и построчная синхронизация
+    # Treeview. load_error_message - начало сообщения об ошибке загрузки
+    load_error_message = "Не удалось загрузить данные"
+
+    def _load_list(self, key, load, show) -> None:
+
+        # load(source) читает данные (source - представление или контроллеры
+        # потока загрузки), show(result) выводит их в потоке Tk
+        if self.loader is not None:
+            self.loading_label.config(text="Загрузка...")
+            self.loader.submit(key, load, show, self._on_load_error)
+            return
+
+        try:
+            show(load(self))
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"{self.load_error_message}: {e}")
+
+    def _sync_rows(self, key, rows, pairs) -> None:
+
+        # rows - KeyedTree, pairs - (id, values). При фоновой загрузке строки
+        # вставляются пачками и перестают, как только придет новый запрос key
+        is_current = None
+        if self.loader is not None:
+            is_current = partial(self.loader.is_current, key, self.loader.current(key))
+
+        rows.sync(
+            pairs,
+            chunk_size=LOAD_CHUNK_SIZE if self.loader is not None else None,
+            is_current=is_current,
+            on_done=self._loading_done
+        )
+
+    def _loading_done(self) -> None:
+
+        self.loading_label.config(text="")
+
+    def _on_load_error(self, error) -> None:
+
+        self._loading_done()
+        messagebox.showerror("Ошибка", f"{self.load_error_message}: {error}")
@@ -5,14 +5,25 @@ from tkinter import ttk
 from views.task_view import TaskView
 from views.project_view import ProjectView
 from views.user_view import UserView
+from views.background import BackgroundLoader
 
 class MainWindow(tk.Tk):
-    def __init__(self, task_controller, project_controller, user_controller) -> None:
+    def __init__(self, task_controller, project_controller, user_controller,
+                 virtual_tasks=False) -> None:
         super().__init__()
         
         self.task_controller = task_controller
         self.project_controller = project_controller
         self.user_controller = user_controller
+        self.virtual_tasks = virtual_tasks  # Виртуальный список задач для больших баз
+        
+        # Списки загружаются в фоновом потоке со своим соединением;
+        # для базы в памяти второе соединение невозможно - грузим в потоке Tk
+        db_manager = task_controller.db_manager
+        self.loader = None
+        if db_manager.db_path != ":memory:":
+            self.loader = BackgroundLoader.for_manager(self, db_manager)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.title("Система управления задачами")
         self.geometry("1000x700")
@@ -62,11 +73,12 @@ class MainWindow(tk.Tk):
         
         
         self.task_view = TaskView(self.task_frame, self.task_controller, 
-                                 self.project_controller, self.user_controller)
+                                 self.project_controller, self.user_controller,
+                                 loader=self.loader, virtual=self.virtual_tasks)
         self.project_view = ProjectView(self.project_frame, self.project_controller,
-                                       self.task_controller)
+                                       self.task_controller, loader=self.loader)
         self.user_view = UserView(self.user_frame, self.user_controller,
-                                 self.task_controller)
+                                 self.task_controller, loader=self.loader)
     
     def _create_status_bar(self):
        
@@ -87,6 +99,12 @@ class MainWindow(tk.Tk):
         
         tk.messagebox.showinfo("О программе", about_text)
     
+    def _on_close(self):
+        
+        if self.loader is not None:
+            self.loader.close()
+        self.destroy()
+    
     def update_status(self, message):
         
         self.status_bar.config(text=message)
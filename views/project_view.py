@@ -1,12 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
+from views.background import BackgroundListMixin
+from views.tree_sync import KeyedTree
 
-class ProjectView(ttk.Frame):
-    def __init__(self, parent, project_controller, task_controller) -> None:
+class ProjectView(BackgroundListMixin, ttk.Frame):
+    load_error_message = "Не удалось загрузить проекты"
+
+    def __init__(self, parent, project_controller, task_controller, loader=None) -> None:
         super().__init__(parent)
         self.project_controller = project_controller
         self.task_controller = task_controller
+        self.loader = loader  # BackgroundLoader; None - загрузка в потоке Tk
         
         self.pack(fill='both', expand=True)
         self.create_widgets()
@@ -79,6 +84,9 @@ class ProjectView(ttk.Frame):
         ttk.Button(control_frame, text="Показать задачи", 
                   command=self.show_project_tasks).pack(side='right', padx=(0, 5))
         
+        self.loading_label = ttk.Label(control_frame, text="")
+        self.loading_label.pack(side='left')
+        
         
         columns = ("ID", "Название", "Статус", "Начало", "Окончание", "Прогресс", "Задач")
         self.projects_tree = ttk.Treeview(right_frame, columns=columns, show='headings', height=15)
@@ -101,6 +109,8 @@ class ProjectView(ttk.Frame):
         
         scrollbar = ttk.Scrollbar(right_frame, orient='vertical', command=self.projects_tree.yview)
         self.projects_tree.configure(yscrollcommand=scrollbar.set)
+        # Строки адресуются id проекта - обновляются только изменившиеся
+        self.project_rows = KeyedTree(self.projects_tree)
         
         self.projects_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -110,42 +120,64 @@ class ProjectView(ttk.Frame):
 
     def refresh_projects(self) -> None:
         
-        try:
-            
-            for item in self.projects_tree.get_children():
-                self.projects_tree.delete(item)
-            
-            
-            projects = self.project_controller.get_all_projects()
-            
-            
-            for project in projects:
-                
-                tasks_count = len(self.task_controller.get_tasks_by_project(project.id))
-                
-                
-                progress = self.project_controller.get_project_progress(project.id)
-                
-                
-                status_map = {
-                    "active": "Активный",
-                    "completed": "Завершен", 
-                    "on_hold": "На паузе"
-                }
-                status_text = status_map.get(project.status, project.status)
-                
-                self.projects_tree.insert("", "end", values=(
-                    project.id,
-                    project.name,
-                    status_text,
-                    project.start_date.strftime("%Y-%m-%d"),
-                    project.end_date.strftime("%Y-%m-%d"),
-                    f"{progress}%",
-                    tasks_count
-                ))
-                
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Не удалось загрузить проекты: {e}")
+        # Без loader данные читаются сразу в потоке Tk
+        self._load_list('projects', self._load_projects, self._show_projects)
+
+    @staticmethod
+    def _load_projects(source) -> tuple:
+        
+        # source - представление или контроллеры потока загрузки
+        projects = source.project_controller.get_all_projects()
+        
+        # Количество задач и прогресс всех проектов - одним запросом
+        progress_by_project = source.project_controller.get_all_project_progress()
+        return projects, progress_by_project
+
+    def _show_projects(self, data) -> None:
+        
+        projects, progress_by_project = data
+        
+        self._sync_rows('projects', self.project_rows, (
+            (project.id, self._project_values(project, progress_by_project))
+            for project in projects
+        ))
+
+    def _patch_project(self, project_id, index="end") -> None:
+        
+        # Точечное обновление одной строки вместо перезагрузки списка
+        project = self.project_controller.get_project(project_id)
+        if project is None:
+            self.project_rows.remove(project_id)
+            return
+        
+        progress = {project_id: (
+            self.task_controller.count_tasks_for_project(project_id), None,
+            self.project_controller.get_project_progress(project_id)
+        )}
+        self.project_rows.upsert(project_id, self._project_values(project, progress), index)
+
+    @staticmethod
+    def _project_values(project, progress_by_project) -> tuple:
+        
+        tasks_count, _, progress = progress_by_project.get(project.id, (0, 0, 0.0))
+        
+        
+        status_map = {
+            "active": "Активный",
+            "completed": "Завершен", 
+            "on_hold": "На паузе"
+        }
+        status_text = status_map.get(project.status, project.status)
+        
+        return (
+            project.id,
+            project.name,
+            status_text,
+            project.start_date.strftime("%Y-%m-%d"),
+            project.end_date.strftime("%Y-%m-%d"),
+            f"{progress}%",
+            tasks_count
+        )
 
     def add_project(self) -> None:
         
@@ -182,7 +214,8 @@ class ProjectView(ttk.Frame):
             
             
             self.clear_form()
-            self.refresh_projects()
+            # Список отсортирован от новых к старым - новый проект встает первым
+            self._patch_project(project_id, index=0)
             
         except ValueError as e:
             messagebox.showerror("Ошибка", f"Некорректные данные: {e}")
@@ -225,7 +258,7 @@ class ProjectView(ttk.Frame):
             )
             
             messagebox.showinfo("Успех", f"Проект '{name}' обновлен")
-            self.refresh_projects()
+            self._patch_project(project_id)
             
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось обновить проект: {e}")
@@ -244,7 +277,7 @@ class ProjectView(ttk.Frame):
             try:
                 if self.project_controller.delete_project(project_id):
                     messagebox.showinfo("Успех", "Проект удален")
-                    self.refresh_projects()
+                    self.project_rows.remove(project_id)
                     self.clear_form()
                 else:
                     messagebox.showerror("Ошибка", "Не удалось удалить проект")
@@ -286,7 +319,7 @@ class ProjectView(ttk.Frame):
                 
                 
                 progress = self.project_controller.get_project_progress(project_id)
-                tasks_count = len(self.task_controller.get_tasks_by_project(project_id))
+                tasks_count = self.task_controller.count_tasks_for_project(project_id)
                 self.progress_label.config(
                     text=f"Прогресс: {progress}%\nЗадач: {tasks_count}"
                 )
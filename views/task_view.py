@@ -1,13 +1,34 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
+from views.background import BackgroundListMixin
+from views.tree_sync import KeyedTree
+from views.virtual_tree import VirtualTreeview
 
-class TaskView(ttk.Frame):
-    def __init__(self, parent, task_controller, project_controller, user_controller) -> None:
+# Уточнение поиска ограничивается id найденных строк, только если их не больше
+# этого числа: id передаются параметрами запроса, иначе запрос идет без них
+SEARCH_NARROW_MAX_ROWS = 500
+
+
+class TaskView(BackgroundListMixin, ttk.Frame):
+    load_error_message = "Не удалось загрузить задачи"
+
+    def __init__(self, parent, task_controller, project_controller, user_controller,
+                 loader=None, virtual=False, search_debounce_ms=250) -> None:
         super().__init__(parent)
         self.task_controller = task_controller
         self.project_controller = project_controller
         self.user_controller = user_controller
+        self.loader = loader  # BackgroundLoader; None - загрузка в потоке Tk
+        # Виртуальный список: в Treeview только видимое окно строк
+        self.virtual = virtual
+        self.virtual_tree = None
+        
+        # Живой поиск: запрос уходит через search_debounce_ms после последнего нажатия
+        self.search_debounce_ms = search_debounce_ms
+        self._search_after_id = None
+        self.list_filters = {}  # Фильтры текущего списка ({'query': ...} во время поиска)
+        self._search_cache = None  # (запрос, найденные строки) для уточнения поиска
         
         self.pack(fill='both', expand=True)
         self.create_widgets()
@@ -90,6 +111,9 @@ class TaskView(ttk.Frame):
         ttk.Button(search_frame, text="Обновить список", 
                   command=self.refresh_tasks).pack(side='right')
         
+        self.loading_label = ttk.Label(search_frame, text="")
+        self.loading_label.pack(side='right', padx=5)
+        
         
         columns = ("ID", "Название", "Приоритет", "Статус", "Срок", "Проект", "Исполнитель")
         self.tasks_tree = ttk.Treeview(right_frame, columns=columns, show='headings', height=15)
@@ -105,6 +129,18 @@ class TaskView(ttk.Frame):
         
         scrollbar = ttk.Scrollbar(right_frame, orient='vertical', command=self.tasks_tree.yview)
         self.tasks_tree.configure(yscrollcommand=scrollbar.set)
+        # Строки адресуются id задачи - обновляются только изменившиеся
+        self.task_rows = KeyedTree(self.tasks_tree)
+        
+        if self.virtual:
+            # Окно дочитывается постранично по позиции полосы прокрутки
+            self.virtual_tree = VirtualTreeview(
+                self.task_rows, scrollbar,
+                fetch_rows=lambda offset, limit: self.task_controller.get_task_listing_window(
+                    offset, limit, filters=self.list_filters or None
+                ),
+                row_values=self._task_values
+            )
         
         self.tasks_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -137,49 +173,98 @@ class TaskView(ttk.Frame):
 
     def refresh_tasks(self) -> None:
         
-        try:
-            
-            for item in self.tasks_tree.get_children():
-                self.tasks_tree.delete(item)
-            
-            
-            tasks = self.task_controller.get_all_tasks()
-            
-           
-            for task in tasks:
-                
-                project_name = "Не указан"
-                if task.project_id:
-                    project = self.project_controller.get_project(task.project_id)
-                    if project:
-                        project_name = project.name
-                
-                assignee_name = "Не указан"
-                if task.assignee_id:
-                    user = self.user_controller.get_user(task.assignee_id)
-                    if user:
-                        assignee_name = user.username
-                
-                
-                priority_map = {1: "Высокий", 2: "Средний", 3: "Низкий"}
-                priority_text = priority_map.get(task.priority, "Неизвестно")
-                
-                
-                status_map = {"pending": "Ожидает", "in_progress": "В работе", "completed": "Завершена"}
-                status_text = status_map.get(task.status, task.status)
-                
-                self.tasks_tree.insert("", "end", values=(
-                    task.id,
-                    task.title,
-                    priority_text,
-                    status_text,
-                    task.due_date.strftime("%Y-%m-%d"),
-                    project_name,
-                    assignee_name
-                ))
-                
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Не удалось загрузить задачи: {e}")
+        # Данные могли измениться - найденные ранее строки больше не годятся
+        self._search_cache = None
+        
+        if self.virtual_tree is not None:
+            self._refresh_virtual()
+            return
+        
+        self._search_tasks(dict(self.list_filters))
+
+    def _search_tasks(self, filters) -> None:
+        
+        def show(tasks):
+            if 'query' in filters:
+                self._search_cache = (filters['query'], tasks)
+            self._show_tasks(tasks)
+        
+        # Более новый запрос (обновление или поиск) прерывает этот
+        self._load_list('tasks', lambda source: self._load_tasks(source, filters), show)
+
+    @staticmethod
+    def _load_tasks(source, filters=None) -> list:
+        
+        # source - представление или контроллеры потока загрузки.
+        # Названия проектов и имена исполнителей приходят в том же запросе
+        tasks, _ = source.task_controller.get_task_listing(filters or None)
+        return tasks
+
+    def _show_tasks(self, tasks) -> None:
+        
+        self._sync_rows('tasks', self.task_rows,
+                        ((task.id, self._task_values(task)) for task in tasks))
+
+    def _refresh_virtual(self) -> None:
+        
+        # Общее число строк и первое окно читаются вместе (в фоновом потоке,
+        # с прерыванием более новым запросом); остальные окна - небольшими
+        # keyset-запросами при прокрутке
+        filters = self.list_filters or None
+        start, limit = self.virtual_tree.window_range(self.virtual_tree.top)
+        
+        def load(source):
+            controller = source.task_controller
+            window = controller.get_task_listing_window(start, limit, filters=filters)
+            return controller.count_task_listing(filters), (start, window)
+        
+        self._load_list('tasks', load, self._show_virtual)
+
+    def _show_virtual(self, data) -> None:
+        
+        total, window = data
+        self.virtual_tree.reset(total, window)
+        self._loading_done()
+
+    def _patch_task(self, task_id, index="end") -> None:
+        
+        # Точечное обновление одной строки вместо перезагрузки списка.
+        # В виртуальном режиме сдвигаются позиции - окно перечитывается
+        self._search_cache = None
+        if self.virtual_tree is not None:
+            self.refresh_tasks()
+            return
+        
+        # С активными фильтрами (поиск) строка остается, только если подходит под них
+        rows, _ = self.task_controller.get_task_listing({**self.list_filters, 'ids': [task_id]})
+        if rows:
+            self.task_rows.upsert(task_id, self._task_values(rows[0]), index)
+        else:
+            self.task_rows.remove(task_id)
+
+    @staticmethod
+    def _task_values(task) -> tuple:
+        
+        project_name = task.project_name or "Не указан"
+        assignee_name = task.assignee_name or "Не указан"
+        
+        
+        priority_map = {1: "Высокий", 2: "Средний", 3: "Низкий"}
+        priority_text = priority_map.get(task.priority, "Неизвестно")
+        
+        
+        status_map = {"pending": "Ожидает", "in_progress": "В работе", "completed": "Завершена"}
+        status_text = status_map.get(task.status, task.status)
+        
+        return (
+            task.id,
+            task.title,
+            priority_text,
+            status_text,
+            task.due_date.strftime("%Y-%m-%d"),
+            project_name,
+            assignee_name
+        )
 
     def add_task(self) -> None:
        
@@ -222,7 +307,8 @@ class TaskView(ttk.Frame):
             
             
             self.clear_form()
-            self.refresh_tasks()
+            # Список отсортирован от новых к старым - новая задача встает первой
+            self._patch_task(task_id, index=0)
             
         except ValueError as e:
             messagebox.showerror("Ошибка", f"Некорректные данные: {e}")
@@ -253,7 +339,7 @@ class TaskView(ttk.Frame):
             try:
                 if self.task_controller.delete_task(task_id):
                     messagebox.showinfo("Успех", "Задача удалена")
-                    self.refresh_tasks()
+                    self._patch_task(task_id)
                 else:
                     messagebox.showerror("Ошибка", "Не удалось удалить задачу")
             except Exception as e:
@@ -271,12 +357,34 @@ class TaskView(ttk.Frame):
 
     def on_search(self, event):
        
+        # Debounce: каждое нажатие откладывает поиск, выполняется только последний
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.search_debounce_ms, self._run_search)
+
+    def _run_search(self) -> None:
+        
+        self._search_after_id = None
         query = self.search_var.get().strip()
-        if not query:
+        if query == self.list_filters.get('query', ''):
+            return
+        
+        self.list_filters = {'query': query} if query else {}
+        if self.virtual_tree is not None:
+            self.virtual_tree.top = 0
             self.refresh_tasks()
-        else:
-            
-            pass
+            return
+        
+        # Запрос уточняет предыдущий (дописаны символы) - ищется только среди
+        # уже найденных строк. Это тот же запрос в базу (в потоке загрузки,
+        # с прерыванием), ограниченный их id
+        cache = self._search_cache
+        if (query and cache is not None and query.startswith(cache[0])
+                and len(cache[1]) <= SEARCH_NARROW_MAX_ROWS):
+            self._search_tasks({'query': query, 'ids': [task.id for task in cache[1]]})
+            return
+        
+        self.refresh_tasks()
 
     def clear_form(self):
         
@@ -0,0 +1,72 @@
+from itertools import islice
+
+
+class KeyedTree:
+    def __init__(self, tree) -> None:
+        # Элементы Treeview адресуются id сущности (iid = str(id)), а последние
+        # выставленные значения хранятся здесь - сравнение идет без запросов к Tk
+        self.tree = tree
+        self.values = {}
+
+    def sync(self, rows, chunk_size=None, is_current=None, on_done=None) -> None:
+
+        # rows - пары (id, values) в нужном порядке. Вставляются только новые
+        # строки, изменяются только отличающиеся, удаляются только пропавшие;
+        # выделение и позиция прокрутки сохраняются.
+        # chunk_size - сколько строк обрабатывать за итерацию цикла Tk
+        # (None - все сразу); обработка прекращается, если is_current() ложно
+        rows = iter(rows)
+        order = []
+
+        def step():
+            if is_current is not None and not is_current():
+                return
+
+            chunk = list(rows) if chunk_size is None else list(islice(rows, chunk_size))
+            for key, values in chunk:
+                order.append(self.upsert(key, values))
+
+            if chunk and chunk_size is not None:
+                self.tree.after(1, step)
+                return
+
+            self._finish(order)
+            if on_done is not None:
+                on_done()
+
+        step()
+
+    def _finish(self, order) -> None:
+
+        stale = self.values.keys() - set(order)
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self.values[iid]
+
+        # Порядок восстанавливается одним вызовом и только при расхождении
+        if list(self.tree.get_children()) != order:
+            self.tree.set_children("", *order)
+
+    def upsert(self, key, values, index="end") -> str:
+
+        iid = str(key)
+        values = tuple(values)
+        current = self.values.get(iid)
+        if current is None:
+            self.tree.insert("", index, iid=iid, values=values)
+        elif current != values:
+            self.tree.item(iid, values=values)
+        self.values[iid] = values
+        return iid
+
+    def remove(self, key) -> None:
+
+        iid = str(key)
+        if self.values.pop(iid, None) is not None:
+            self.tree.delete(iid)
+
+    def clear(self) -> None:
+
+        self.tree.delete(*self.values)
+        self.values.clear()
@@ -1,11 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from views.background import BackgroundListMixin
+from views.tree_sync import KeyedTree
 
-class UserView(ttk.Frame):
-    def __init__(self, parent, user_controller, task_controller) -> None:
+class UserView(BackgroundListMixin, ttk.Frame):
+    load_error_message = "Не удалось загрузить пользователей"
+
+    def __init__(self, parent, user_controller, task_controller, loader=None) -> None:
         super().__init__(parent)
         self.user_controller = user_controller
         self.task_controller = task_controller
+        self.loader = loader  # BackgroundLoader; None - загрузка в потоке Tk
         
         self.pack(fill='both', expand=True)
         self.create_widgets()
@@ -68,6 +73,9 @@ class UserView(ttk.Frame):
         ttk.Button(control_frame, text="Показать задачи", 
                   command=self.show_user_tasks).pack(side='right', padx=(0, 5))
         
+        self.loading_label = ttk.Label(control_frame, text="")
+        self.loading_label.pack(side='left')
+        
         
         columns = ("ID", "Имя пользователя", "Email", "Роль", "Регистрация", "Задач")
         self.users_tree = ttk.Treeview(right_frame, columns=columns, show='headings', height=15)
@@ -89,6 +97,8 @@ class UserView(ttk.Frame):
         
         scrollbar = ttk.Scrollbar(right_frame, orient='vertical', command=self.users_tree.yview)
         self.users_tree.configure(yscrollcommand=scrollbar.set)
+        # Строки адресуются id пользователя - обновляются только изменившиеся
+        self.user_rows = KeyedTree(self.users_tree)
         
         self.users_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -98,38 +108,59 @@ class UserView(ttk.Frame):
 
     def refresh_users(self) -> None:
         
-        try:
-            
-            for item in self.users_tree.get_children():
-                self.users_tree.delete(item)
-            
-            
-            users = self.user_controller.get_all_users()
-            
-            
-            for user in users:
-                
-                tasks_count = len(self.task_controller.get_tasks_by_user(user.id))
-                
-                
-                role_map = {
-                    "admin": "Администратор",
-                    "manager": "Менеджер", 
-                    "developer": "Разработчик"
-                }
-                role_text = role_map.get(user.role, user.role)
-                
-                self.users_tree.insert("", "end", values=(
-                    user.id,
-                    user.username,
-                    user.email,
-                    role_text,
-                    user.registration_date.strftime("%Y-%m-%d"),
-                    tasks_count
-                ))
-                
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Не удалось загрузить пользователей: {e}")
+        # Без loader данные читаются сразу в потоке Tk
+        self._load_list('users', self._load_users, self._show_users)
+
+    @staticmethod
+    def _load_users(source) -> tuple:
+        
+        # source - представление или контроллеры потока загрузки
+        users = source.user_controller.get_all_users()
+        
+        # Количество задач всех пользователей - одним GROUP BY
+        tasks_by_user = source.task_controller.count_tasks_by_user()
+        return users, tasks_by_user
+
+    def _show_users(self, data) -> None:
+        
+        users, tasks_by_user = data
+        
+        self._sync_rows('users', self.user_rows, (
+            (user.id, self._user_values(user, tasks_by_user)) for user in users
+        ))
+
+    def _patch_user(self, user_id, index="end") -> None:
+        
+        # Точечное обновление одной строки вместо перезагрузки списка
+        user = self.user_controller.get_user(user_id)
+        if user is None:
+            self.user_rows.remove(user_id)
+            return
+        
+        tasks_by_user = {user_id: self.task_controller.count_tasks_for_user(user_id)}
+        self.user_rows.upsert(user_id, self._user_values(user, tasks_by_user), index)
+
+    @staticmethod
+    def _user_values(user, tasks_by_user) -> tuple:
+        
+        tasks_count = tasks_by_user.get(user.id, 0)
+        
+        
+        role_map = {
+            "admin": "Администратор",
+            "manager": "Менеджер", 
+            "developer": "Разработчик"
+        }
+        role_text = role_map.get(user.role, user.role)
+        
+        return (
+            user.id,
+            user.username,
+            user.email,
+            role_text,
+            user.registration_date.strftime("%Y-%m-%d"),
+            tasks_count
+        )
 
     def add_user(self) -> None:
         
@@ -159,7 +190,8 @@ class UserView(ttk.Frame):
             
             
             self.clear_form()
-            self.refresh_users()
+            # Список отсортирован от новых к старым - новый пользователь встает первым
+            self._patch_user(user_id, index=0)
             
         except ValueError as e:
             messagebox.showerror("Ошибка", f"Некорректные данные: {e}")
@@ -198,7 +230,7 @@ class UserView(ttk.Frame):
             )
             
             messagebox.showinfo("Успех", f"Пользователь '{username}' обновлен")
-            self.refresh_users()
+            self._patch_user(user_id)
             
         except ValueError as e:
             messagebox.showerror("Ошибка", f"Некорректные данные: {e}")
@@ -219,7 +251,7 @@ class UserView(ttk.Frame):
             try:
                 if self.user_controller.delete_user(user_id):
                     messagebox.showinfo("Успех", "Пользователь удален")
-                    self.refresh_users()
+                    self.user_rows.remove(user_id)
                     self.clear_form()
                 else:
                     messagebox.showerror("Ошибка", "Не удалось удалить пользователя")
@@ -251,7 +283,7 @@ class UserView(ttk.Frame):
             
            
             user_id = values[0]
-            tasks_count = len(self.task_controller.get_tasks_by_user(user_id))
+            tasks_count = self.task_controller.count_tasks_for_user(user_id)
             self.info_label.config(
                 text=f"Пользователь: {values[1]}\nЗадач: {tasks_count}\nРоль: {values[3]}"
             )
@@ -266,7 +298,7 @@ class UserView(ttk.Frame):
         user_id = self.users_tree.item(selected[0])['values'][0]
         username = self.users_tree.item(selected[0])['values'][1]
         
-        tasks = self.task_controller.get_tasks_by_user(user_id)
+        tasks, _ = self.task_controller.get_task_listing(filters={'assignee_id': user_id})
         
         if not tasks:
             messagebox.showinfo("Информация", f"У пользователя '{username}' нет задач")
@@ -300,12 +332,7 @@ class UserView(ttk.Frame):
             status_map = {"pending": "Ожидает", "in_progress": "В работе", "completed": "Завершена"}
             
             
-            project_name = "Не указан"
-            if task.project_id:
-                from controllers.project_controller import ProjectController
-                project = self.task_controller.project_controller.get_project(task.project_id)
-                if project:
-                    project_name = project.name
+            project_name = task.project_name or "Не указан"
             
             tasks_tree.insert("", "end", values=(
                 task.id,
@@ -0,0 +1,136 @@
+from operator import attrgetter
+
+# Высота строки Treeview по умолчанию (Tk 8.6), пока строки не отрисованы
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTreeview:
+    def __init__(self, rows, scrollbar, fetch_rows, row_values, row_key=attrgetter('id'),
+                 margin=100) -> None:
+        # Виртуальный список: в Treeview живут только видимые строки и запас
+        # margin с каждой стороны. Полоса прокрутки управляется не Treeview,
+        # а позицией в полном списке из total строк; при выходе за пределы
+        # окна строки заново читаются через fetch_rows(offset, limit).
+        # rows - KeyedTree: при сдвиге окна в Tk уходят только новые строки
+        self.rows = rows
+        self.tree = tree = rows.tree
+        self.scrollbar = scrollbar
+        self.fetch_rows = fetch_rows
+        self.row_values = row_values
+        self.row_key = row_key
+        self.margin = margin
+
+        self.total = 0
+        self.top = 0  # Индекс первой видимой строки в полном списке
+        # Сколько строк помещается в Treeview. Дерево растягивается вместе с
+        # окном, поэтому число пересчитывается по фактической высоте на
+        # <Configure>; до первой отрисовки берется опция height
+        self.visible = int(tree.cget('height'))
+        self._row_metrics = None  # (высота заголовка, высота строки) в пикселях
+        self.window_start = 0  # Индекс первой материализованной строки
+        self.window_rows = []
+
+        scrollbar.configure(command=self.on_scrollbar)
+        # Собственная прокрутка Treeview ходит только внутри окна
+        tree.configure(yscrollcommand=lambda *args: None)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            tree.bind(sequence, self.on_wheel)
+        tree.bind('<Configure>', self.on_configure, add='+')
+
+    def on_configure(self, event=None) -> None:
+
+        visible = self._fit_rows()
+        if visible != self.visible:
+            self.visible = visible
+            self.scroll_to(self.top)
+
+    def _fit_rows(self) -> int:
+
+        height = self.tree.winfo_height()
+        if height <= 1:  # Виджет еще не отображен
+            return self.visible
+        header_height, row_height = self._measure_rows()
+        return max(1, (height - header_height) // row_height)
+
+    def _measure_rows(self) -> tuple:
+
+        # По bbox первой видимой строки: y - высота заголовка, h - высота строки.
+        # Пока строки не отрисованы, заголовок и строка оцениваются DEFAULT_ROW_HEIGHT
+        index = self.top - self.window_start
+        if self._row_metrics is None and 0 <= index < len(self.window_rows):
+            bbox = self.tree.bbox(str(self.row_key(self.window_rows[index])))
+            if bbox:
+                self._row_metrics = (bbox[1], bbox[3])
+        return self._row_metrics or (DEFAULT_ROW_HEIGHT, DEFAULT_ROW_HEIGHT)
+
+    def window_range(self, top) -> tuple:
+
+        # (offset, limit) окна, в котором строка top видна вместе с запасом margin
+        return max(0, top - self.margin), self.visible + 2 * self.margin
+
+    def reset(self, total, window=None) -> None:
+
+        # Данные изменились: окно перечитывается с сохранением позиции.
+        # window - (offset, строки), уже прочитанное окно по window_range
+        # (например, в фоновом потоке) - тогда fetch_rows не вызывается
+        self.total = total
+        self.window_rows = []
+        if window is None and not total:
+            window = (0, [])
+        if window is not None:
+            self._show_window(*window)
+        self.scroll_to(self.top)
+        # Размеры строк известны только после отрисовки - уточняем число видимых
+        self.tree.after_idle(self.on_configure)
+
+    def scroll_to(self, top) -> None:
+
+        top = max(0, min(top, self.total - self.visible))
+        self.top = top
+        end = min(top + self.visible, self.total)
+
+        window_end = self.window_start + len(self.window_rows)
+        outside = top < self.window_start or end > window_end
+        if self.total and (not self.window_rows or outside):
+            self._load_window(top)
+
+        if self.window_rows:
+            self.tree.yview_moveto((top - self.window_start) / len(self.window_rows))
+        self._update_scrollbar()
+
+    def _load_window(self, top) -> None:
+
+        start, limit = self.window_range(top)
+        self._show_window(start, self.fetch_rows(start, limit))
+
+    def _show_window(self, start, rows) -> None:
+
+        self.window_start = start
+        self.window_rows = rows
+        self.rows.sync((self.row_key(row), self.row_values(row)) for row in rows)
+
+    def _update_scrollbar(self) -> None:
+
+        if not self.total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        end = min(self.top + self.visible, self.total)
+        self.scrollbar.set(self.top / self.total, end / self.total)
+
+    def on_scrollbar(self, *args) -> None:
+
+        # Команды ttk.Scrollbar: ('moveto', доля) или ('scroll', n, 'units' | 'pages')
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * self.total))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self.visible if args[2] == 'pages' else 1)
+            self.scroll_to(self.top + step)
+
+    def on_wheel(self, event) -> str:
+
+        # Button-4/5 - X11, MouseWheel - Windows/macOS
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return 'break'